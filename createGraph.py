@@ -5,37 +5,111 @@ Build a Midgard travel graph and export it to JSON.
 Each node models a city or landmark with its own attributes, and each edge
 models a route segment with travel-specific metadata (terrain, allowed modes,
 seasonal notes, etc.). The resulting JSON can be fed into a travel calculator
-that computes travel time based on the routes chosen.
+that computes travel time based on the routes chosen. Paths ending in .mpk or
+.mpk.zst are written as MessagePack (zstd-compressed for .zst) instead.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    import msgpack  # type: ignore
+except Exception:
+    msgpack = None
+
+try:
+    import zstandard  # type: ignore
+except Exception:
+    zstandard = None
+
+
+def _canon(a: str, b: str) -> tuple[str, str]:
+    """Return the node pair in key order without building a sorted list."""
+    return (a, b) if a <= b else (b, a)
+
+
+def _interned(value: Any) -> Any:
+    """Intern a string (or the strings in a list) so repeated values share one object."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [sys.intern(v) if isinstance(v, str) else v for v in value]
+    return value
+
+
+def _intern_id(node_id: Any) -> Any:
+    """Intern string node ids; other id types (e.g. ints) are kept as they are."""
+    return sys.intern(node_id) if isinstance(node_id, str) else node_id
+
+
+def _is_msgpack(path: Path) -> bool:
+    return path.name.endswith((".mpk", ".mpk.zst"))
+
+
+def _require(module: Any, name: str) -> Any:
+    if module is None:
+        raise RuntimeError(f"{name} is required for .mpk/.mpk.zst graphs: pip install {name}")
+    return module
+
+
+def _load_payload(path: Path) -> Dict[str, Any]:
+    if _is_msgpack(path):
+        raw = path.read_bytes()
+        if path.name.endswith(".zst"):
+            raw = _require(zstandard, "zstandard").ZstdDecompressor().decompress(raw)
+        return _require(msgpack, "msgpack").unpackb(raw, raw=False)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_payload(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if _is_msgpack(path):
+        raw = _require(msgpack, "msgpack").packb(payload, use_bin_type=True)
+        if path.name.endswith(".zst"):
+            raw = _require(zstandard, "zstandard").ZstdCompressor().compress(raw)
+        path.write_bytes(raw)
+        return
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=False)
 
 
 class Graph:
     def __init__(self) -> None:
+        # Node attrs keyed by id; the "id" field itself is only added on export.
         self.nodes: Dict[str, Dict[str, Any]] = {}
         # Undirected edges keyed by a sorted node-pair tuple for easy merging.
         self.edges: Dict[tuple[str, str], Dict[str, Any]] = {}
 
     def add_node(self, node_id: str, **attrs: Any) -> None:
         """Add or update a node (city/landmark) with arbitrary attributes."""
-        payload = {"id": node_id, **attrs}
-        if node_id in self.nodes:
-            self.nodes[node_id].update(payload)
+        existing = self.nodes.get(node_id)
+        if existing is None:
+            self.nodes[node_id] = attrs
         else:
-            self.nodes[node_id] = payload
+            existing.update(attrs)
 
     def add_edge(self, source: str, target: str, **attrs: Any) -> None:
         """Add an undirected edge (route segment) with arbitrary attributes."""
         if source not in self.nodes or target not in self.nodes:
             missing = [n for n in (source, target) if n not in self.nodes]
             raise ValueError(f"Add nodes first before linking them: {missing}")
-        key = tuple(sorted((source, target)))
+        key = _canon(source, target)
         edge_payload = {
             "nodes": [key[0], key[1]],
             "undirected": True,
@@ -46,25 +120,61 @@ class Graph:
         else:
             self.edges[key] = edge_payload
 
-    def to_dict(self) -> Dict[str, Any]:
+    def add_nodes_bulk(self, nodes: Iterable[tuple[str, Dict[str, Any]]]) -> None:
+        """Add or update many (node_id, attrs) pairs; same merge rules as add_node."""
+        for node_id, attrs in nodes:
+            existing = self.nodes.get(node_id)
+            if existing is None:
+                self.nodes[node_id] = dict(attrs)
+            else:
+                existing.update(attrs)
+
+    def add_edges_bulk(self, edges: Iterable[tuple[str, str, Dict[str, Any]]]) -> None:
+        """Add many (source, target, attrs) edges, validating all endpoints up front."""
+        edges = list(edges)
+        missing = {n for a, b, _ in edges for n in (a, b) if n not in self.nodes}
+        if missing:
+            raise ValueError(f"Add nodes first before linking them: {sorted(missing)}")
+        for a, b, attrs in edges:
+            key = _canon(a, b)
+            # Fresh lists per graph, so callers' attrs (e.g. the shared _EDGES) are never mutated through it.
+            edge_payload = {
+                "nodes": [key[0], key[1]],
+                "undirected": True,
+                **{k: list(v) if isinstance(v, list) else v for k, v in attrs.items()},
+            }
+            existing = self.edges.get(key)
+            if existing is None:
+                self.edges[key] = edge_payload
+            else:
+                existing.update(edge_payload)
+
+    def to_dict(self, sort: bool = False) -> Dict[str, Any]:
+        """Export nodes/edges in insertion order, or sorted by id/key if `sort`."""
+        if sort:
+            return {
+                "nodes": [{"id": k, **self.nodes[k]} for k in sorted(self.nodes)],
+                "edges": [self.edges[k] for k in sorted(self.edges)],
+            }
         return {
-            "nodes": [self.nodes[k] for k in sorted(self.nodes)],
-            "edges": [self.edges[k] for k in sorted(self.edges)],
+            "nodes": [{"id": k, **v} for k, v in self.nodes.items()],
+            "edges": list(self.edges.values()),
         }
 
     def save(self, path: Path) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, sort_keys=False)
+        _dump_payload(path, self.to_dict())
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Graph":
+        # Interning lets repeated values (terrain, modes, node ids in edges) share one
+        # string object, which adds up on large graphs.
         graph = cls()
-        for node in data.get("nodes", []):
-            node_id = node["id"]
-            attrs = {k: v for k, v in node.items() if k != "id"}
-            graph.add_node(node_id, **attrs)
+        graph.add_nodes_bulk(
+            (_intern_id(node["id"]), {k: _interned(v) for k, v in node.items() if k != "id"})
+            for node in data.get("nodes", [])
+        )
 
+        edges = []
         for edge in data.get("edges", []):
             if "nodes" in edge and len(edge["nodes"]) == 2:
                 a, b = edge["nodes"]
@@ -74,206 +184,247 @@ class Graph:
                 raise ValueError(f"Edge missing node identifiers: {edge}")
 
             attrs = {
-                k: v
+                k: _interned(v)
                 for k, v in edge.items()
                 if k not in {"nodes", "source", "target"}
             }
-            graph.add_edge(a, b, **attrs)
+            edges.append((_intern_id(a), _intern_id(b), attrs))
+        graph.add_edges_bulk(edges)
 
         return graph
 
     @classmethod
     def from_file(cls, path: Path) -> "Graph":
-        with path.open(encoding="utf-8") as f:
-            data = json.load(f)
-        return cls.from_dict(data)
-
+        return cls.from_dict(_load_payload(path))
 
-def build_midgard_graph(base: Graph | None = None) -> Graph:
-    """Define a small sample network of Midgard locations and routes."""
-    graph = base or Graph()
 
-    graph.add_node(
+# Sample data for build_midgard_graph: (id, attrs) nodes and (source, target, attrs)
+# edges. Built once at import; the bulk adders copy them into each graph.
+_NODES: tuple[tuple[str, Dict[str, Any]], ...] = (
+    (
         "Valstaad",
-        kind="port_city",
-        region="North Sea coast",
-        population=12000,
-        is_port=True,
-        terrain="coastal plains",
-        notes="Main northern trading hub with reliable shipyards.",
-    )
-    graph.add_node(
+        {
+            "kind": "port_city",
+            "region": "North Sea coast",
+            "population": 12000,
+            "is_port": True,
+            "terrain": "coastal plains",
+            "notes": "Main northern trading hub with reliable shipyards.",
+        },
+    ),
+    (
         "Thornwell",
-        kind="market_town",
-        region="Heartland",
-        population=5500,
-        is_port=False,
-        terrain="farmland",
-        notes="Crossroads town with an annual horse fair.",
-    )
-    graph.add_node(
+        {
+            "kind": "market_town",
+            "region": "Heartland",
+            "population": 5500,
+            "is_port": False,
+            "terrain": "farmland",
+            "notes": "Crossroads town with an annual horse fair.",
+        },
+    ),
+    (
         "Rivermeet",
-        kind="river_port",
-        region="Heartland",
-        population=4300,
-        is_port=True,
-        terrain="river valley",
-        notes="Barges change hands here; city has secure warehouses.",
-    )
-    graph.add_node(
+        {
+            "kind": "river_port",
+            "region": "Heartland",
+            "population": 4300,
+            "is_port": True,
+            "terrain": "river valley",
+            "notes": "Barges change hands here; city has secure warehouses.",
+        },
+    ),
+    (
         "Fjellhaven",
-        kind="mountain_hold",
-        region="Frostspire Mountains",
-        population=2200,
-        is_port=False,
-        terrain="high mountains",
-        notes="Steep approach; pass closes after heavy snows.",
-    )
-    graph.add_node(
+        {
+            "kind": "mountain_hold",
+            "region": "Frostspire Mountains",
+            "population": 2200,
+            "is_port": False,
+            "terrain": "high mountains",
+            "notes": "Steep approach; pass closes after heavy snows.",
+        },
+    ),
+    (
         "Oakheart",
-        kind="forest_village",
-        region="Silverwood",
-        population=1300,
-        is_port=False,
-        terrain="dense forest",
-        notes="Woodcutters and rangers; frequent wolf sightings.",
-    )
-    graph.add_node(
+        {
+            "kind": "forest_village",
+            "region": "Silverwood",
+            "population": 1300,
+            "is_port": False,
+            "terrain": "dense forest",
+            "notes": "Woodcutters and rangers; frequent wolf sightings.",
+        },
+    ),
+    (
         "Stormwatch Keep",
-        kind="fortress",
-        region="Windshore Cliffs",
-        population=800,
-        is_port=False,
-        terrain="clifftop",
-        notes="Signal beacons mark safe coves during storms.",
-    )
-    graph.add_node(
+        {
+            "kind": "fortress",
+            "region": "Windshore Cliffs",
+            "population": 800,
+            "is_port": False,
+            "terrain": "clifftop",
+            "notes": "Signal beacons mark safe coves during storms.",
+        },
+    ),
+    (
         "Isenfjord",
-        kind="fishing_hamlet",
-        region="Frozen Coast",
-        population=900,
-        is_port=True,
-        terrain="arctic shore",
-        notes="Sea ice common in late winter; small sheltered harbor.",
-    )
+        {
+            "kind": "fishing_hamlet",
+            "region": "Frozen Coast",
+            "population": 900,
+            "is_port": True,
+            "terrain": "arctic shore",
+            "notes": "Sea ice common in late winter; small sheltered harbor.",
+        },
+    ),
+)
 
+_EDGES: tuple[tuple[str, str, Dict[str, Any]], ...] = (
     # Overland routes
-    graph.add_edge(
+    (
         "Valstaad",
         "Thornwell",
-        route_type="road",
-        approx_distance_km=140,
-        surface="paved",
-        terrain="plains",
-        allowed_modes=["foot", "horse", "wagon"],
-        tolls=False,
-        typical_rest_stops=["Wayside Inn", "Red Ford"],
-    )
-    graph.add_edge(
+        {
+            "route_type": "road",
+            "approx_distance_km": 140,
+            "surface": "paved",
+            "terrain": "plains",
+            "allowed_modes": ["foot", "horse", "wagon"],
+            "tolls": False,
+            "typical_rest_stops": ["Wayside Inn", "Red Ford"],
+        },
+    ),
+    (
         "Thornwell",
         "Rivermeet",
-        route_type="road",
-        approx_distance_km=60,
-        surface="packed earth",
-        terrain="farmland",
-        allowed_modes=["foot", "horse", "wagon"],
-        tolls=False,
-        hazards=["spring floods near the river"],
-    )
-    graph.add_edge(
+        {
+            "route_type": "road",
+            "approx_distance_km": 60,
+            "surface": "packed earth",
+            "terrain": "farmland",
+            "allowed_modes": ["foot", "horse", "wagon"],
+            "tolls": False,
+            "hazards": ["spring floods near the river"],
+        },
+    ),
+    (
         "Rivermeet",
         "Oakheart",
-        route_type="trail",
-        approx_distance_km=45,
-        surface="forest path",
-        terrain="forest",
-        allowed_modes=["foot", "horse"],
-        tolls=False,
-        hazards=["bandits near the old mill"],
-    )
-    graph.add_edge(
+        {
+            "route_type": "trail",
+            "approx_distance_km": 45,
+            "surface": "forest path",
+            "terrain": "forest",
+            "allowed_modes": ["foot", "horse"],
+            "tolls": False,
+            "hazards": ["bandits near the old mill"],
+        },
+    ),
+    (
         "Thornwell",
         "Fjellhaven",
-        route_type="mountain_pass",
-        approx_distance_km=110,
-        surface="stone and scree",
-        terrain="mountain",
-        allowed_modes=["foot", "horse", "pack_lizard"],
-        tolls=True,
-        seasonal_availability="closed after first heavy snow",
-        hazards=["rockfalls", "thin air"],
-    )
-    graph.add_edge(
+        {
+            "route_type": "mountain_pass",
+            "approx_distance_km": 110,
+            "surface": "stone and scree",
+            "terrain": "mountain",
+            "allowed_modes": ["foot", "horse", "pack_lizard"],
+            "tolls": True,
+            "seasonal_availability": "closed after first heavy snow",
+            "hazards": ["rockfalls", "thin air"],
+        },
+    ),
+    (
         "Oakheart",
         "Stormwatch Keep",
-        route_type="clifftop_track",
-        approx_distance_km=70,
-        surface="rocky",
-        terrain="cliffs",
-        allowed_modes=["foot", "horse"],
-        tolls=False,
-        hazards=["high winds"],
-    )
+        {
+            "route_type": "clifftop_track",
+            "approx_distance_km": 70,
+            "surface": "rocky",
+            "terrain": "cliffs",
+            "allowed_modes": ["foot", "horse"],
+            "tolls": False,
+            "hazards": ["high winds"],
+        },
+    ),
 
     # River and sea routes
-    graph.add_edge(
+    (
         "Rivermeet",
         "Valstaad",
-        route_type="river",
-        approx_distance_km=160,
-        current="moderate",
-        terrain="river",
-        allowed_modes=["barge", "river_boat"],
-        requires_portage=False,
-        notes="Fast downstream, slower upstream; guarded stretches near Valstaad.",
-    )
-    graph.add_edge(
+        {
+            "route_type": "river",
+            "approx_distance_km": 160,
+            "current": "moderate",
+            "terrain": "river",
+            "allowed_modes": ["barge", "river_boat"],
+            "requires_portage": False,
+            "notes": "Fast downstream, slower upstream; guarded stretches near Valstaad.",
+        },
+    ),
+    (
         "Valstaad",
         "Isenfjord",
-        route_type="sea_lane",
-        approx_distance_km=320,
-        open_sea=True,
-        along_shore=False,
-        allowed_modes=["sail", "row", "knarr"],
-        hazards=["squalls", "icebergs late winter"],
-        preferred_weather="calm seas",
-    )
-    graph.add_edge(
+        {
+            "route_type": "sea_lane",
+            "approx_distance_km": 320,
+            "open_sea": True,
+            "along_shore": False,
+            "allowed_modes": ["sail", "row", "knarr"],
+            "hazards": ["squalls", "icebergs late winter"],
+            "preferred_weather": "calm seas",
+        },
+    ),
+    (
         "Valstaad",
         "Stormwatch Keep",
-        route_type="sea_lane",
-        approx_distance_km=85,
-        open_sea=False,
-        along_shore=True,
-        allowed_modes=["sail", "row"],
-        hazards=["shoals near Beacon Point"],
-        notes="Faster in clear weather; beacon fires guide night approach.",
-    )
-    graph.add_edge(
+        {
+            "route_type": "sea_lane",
+            "approx_distance_km": 85,
+            "open_sea": False,
+            "along_shore": True,
+            "allowed_modes": ["sail", "row"],
+            "hazards": ["shoals near Beacon Point"],
+            "notes": "Faster in clear weather; beacon fires guide night approach.",
+        },
+    ),
+    (
         "Stormwatch Keep",
         "Isenfjord",
-        route_type="sea_lane",
-        approx_distance_km=260,
-        open_sea=False,
-        along_shore=True,
-        allowed_modes=["sail", "row", "knarr"],
-        hazards=["ice floes", "fog banks"],
-    )
+        {
+            "route_type": "sea_lane",
+            "approx_distance_km": 260,
+            "open_sea": False,
+            "along_shore": True,
+            "allowed_modes": ["sail", "row", "knarr"],
+            "hazards": ["ice floes", "fog banks"],
+        },
+    ),
 
     # Second declaration of the same connection merges in extra metadata.
-    graph.add_edge(
+    (
         "Rivermeet",
         "Thornwell",
-        route_type="road",
-        approx_distance_km=60,
-        surface="packed earth",
-        terrain="farmland",
-        allowed_modes=["foot", "horse", "wagon"],
-        tolls=False,
-        hazards=["spring floods near the river"],
-        notes="Defined separately in case travel modifiers differ upstream.",
-    )
+        {
+            "route_type": "road",
+            "approx_distance_km": 60,
+            "surface": "packed earth",
+            "terrain": "farmland",
+            "allowed_modes": ["foot", "horse", "wagon"],
+            "tolls": False,
+            "hazards": ["spring floods near the river"],
+            "notes": "Defined separately in case travel modifiers differ upstream.",
+        },
+    ),
+)
+
 
+def build_midgard_graph(base: Graph | None = None) -> Graph:
+    """Define a small sample network of Midgard locations and routes."""
+    graph = base or Graph()
+    graph.add_nodes_bulk(_NODES)
+    graph.add_edges_bulk(_EDGES)
     return graph
 
 
@@ -8,28 +8,152 @@ Features:
 - Add/modify/remove edges (endpoints, undirected flag, route type, distance, allowed modes).
 - Save back to JSON.
 
-Uses Tkinter only (standard library).
+Uses Tkinter only (standard library). If orjson is installed it is used to
+read and write graph files faster. Files ending in .mpk / .mpk.zst are stored as
+MessagePack (optionally zstd-compressed) and need msgpack / zstandard.
 """
 
 from __future__ import annotations
 
 import argparse
+import bisect
 import json
+import sys
 import tkinter as tk
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    import msgpack  # type: ignore
+except Exception:
+    msgpack = None
+
+try:
+    import zstandard  # type: ignore
+except Exception:
+    zstandard = None
 
 
 ROUTE_TYPES = ["road", "trail", "mountain_pass", "sea", "shore"]
 ALLOWED_MODES = ["foot", "horse", "boat", "ship"]
+# Undirected edges are keyed by their endpoints in sorted order.
+EdgeKey = Tuple[str, str]
+IO_POLL_MS = 50
+# Derived values cached on each edge dict; never written to disk.
+CACHED_EDGE_FIELDS = frozenset({"_key", "_label"})
+GRAPH_FILETYPES = [
+    ("JSON files", "*.json"),
+    ("MessagePack files", "*.mpk *.mpk.zst"),
+    ("All files", "*.*"),
+]
+
+
+def _canon(a: str, b: str) -> EdgeKey:
+    """Order an endpoint pair the way edges are keyed (cheaper than tuple(sorted(...)))."""
+    return (a, b) if a <= b else (b, a)
+
+
+def _format_edge_label(edge: Dict[str, Any]) -> str:
+    a, b = edge["nodes"]
+    rtypes = edge.get("route_types") or []
+    rtype = ", ".join(rtypes) if rtypes else edge.get("route_type", "route")
+    dist = edge.get("approx_distance_km")
+    label = f"{a} — {b} ({rtype}"
+    if dist is not None:
+        label += f", {dist} km"
+    return label + ")"
+
+
+def _interned(value: Any) -> Any:
+    """Intern a string (or the strings in a list) so repeated values share one object."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [sys.intern(v) if isinstance(v, str) else v for v in value]
+    return value
+
+
+def _intern_id(node_id: Any) -> Any:
+    """Intern string node ids; other id types (e.g. ints) are kept as they are."""
+    return sys.intern(node_id) if isinstance(node_id, str) else node_id
+
+
+def _is_msgpack(path: Path) -> bool:
+    return path.name.endswith((".mpk", ".mpk.zst"))
+
+
+def _require(module: Any, name: str) -> Any:
+    if module is None:
+        raise RuntimeError(f"{name} is required for .mpk/.mpk.zst graphs: pip install {name}")
+    return module
+
+
+def _load_payload(path: Path) -> Dict[str, Any]:
+    if _is_msgpack(path):
+        raw = path.read_bytes()
+        if path.name.endswith(".zst"):
+            raw = _require(zstandard, "zstandard").ZstdDecompressor().decompress(raw)
+        return _require(msgpack, "msgpack").unpackb(raw, raw=False)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_payload(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if _is_msgpack(path):
+        raw = _require(msgpack, "msgpack").packb(payload, use_bin_type=True)
+        if path.name.endswith(".zst"):
+            raw = _require(zstandard, "zstandard").ZstdCompressor().compress(raw)
+        path.write_bytes(raw)
+        return
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=False)
 
 
 @dataclass
 class GraphData:
     nodes: Dict[str, Dict[str, Any]]
     edges: List[Dict[str, Any]]  # each edge has "nodes": [a, b] and attrs
+    # Sorted node pair -> position in `edges`, kept in sync by every mutator.
+    # Each edge also caches its own pair under "_key" and its list label under
+    # "_label"; both are stripped on save.
+    _edge_index: Dict[EdgeKey, int] = field(default_factory=dict, init=False, repr=False)
+    # Node id -> keys of its incident edges, so node removal only touches those edges.
+    _adj: Dict[str, Set[EdgeKey]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for e in self.edges:
+            if "_key" not in e:
+                e["_key"] = _canon(*e["nodes"])
+            if "_label" not in e:
+                e["_label"] = _format_edge_label(e)
+        self._edge_index = {e["_key"]: i for i, e in enumerate(self.edges)}
+        self._adj = {}
+        for key in self._edge_index:
+            self._link(key)
+
+    def _link(self, key: EdgeKey) -> None:
+        self._adj.setdefault(key[0], set()).add(key)
+        self._adj.setdefault(key[1], set()).add(key)
+
+    def _unlink(self, key: EdgeKey) -> None:
+        for end in key:
+            keys = self._adj.get(end)
+            if keys is not None:
+                keys.discard(key)
 
     @classmethod
     def empty(cls) -> "GraphData":
@@ -37,15 +161,19 @@ class GraphData:
 
     @classmethod
     def load(cls, path: Path) -> "GraphData":
-        with path.open(encoding="utf-8") as f:
-            data = json.load(f)
+        # The parsed dicts are fresh and ours, so they are reused in place rather than copied.
+        data = _load_payload(path)
         nodes: Dict[str, Dict[str, Any]] = {}
+        # Terrain, modes, route types etc. repeat across the graph; interning makes
+        # duplicates share one string object instead of one per occurrence.
         for n in data.get("nodes", []):
-            attrs = {k: v for k, v in n.items() if k != "id"}
-            if "is_port" in attrs:
-                attrs["is_port"] = bool(attrs["is_port"])
-            nodes[n["id"]] = attrs
-        edges: Dict[tuple[str, str], Dict[str, Any]] = {}
+            node_id = _intern_id(n.pop("id"))
+            for k, v in n.items():
+                n[k] = _interned(v)
+            if "is_port" in n:
+                n["is_port"] = bool(n["is_port"])
+            nodes[node_id] = n
+        edges: Dict[EdgeKey, Dict[str, Any]] = {}
         for e in data.get("edges", []):
             if "nodes" in e and len(e["nodes"]) == 2:
                 a, b = e["nodes"]
@@ -53,20 +181,26 @@ class GraphData:
                 a, b = e["source"], e["target"]
             else:
                 raise ValueError(f"Edge missing endpoints: {e}")
-            key = tuple(sorted((a, b)))
-            attrs = {k: v for k, v in e.items() if k not in {"nodes", "source", "target"}}
-            if "allowed_modes" in attrs and not isinstance(attrs["allowed_modes"], list):
-                attrs["allowed_modes"] = list(attrs["allowed_modes"])
-            edges[key] = {"nodes": [key[0], key[1]], **attrs}
+            e.pop("source", None)
+            e.pop("target", None)
+            key = _canon(_intern_id(a), _intern_id(b))
+            if "allowed_modes" in e and not isinstance(e["allowed_modes"], list):
+                e["allowed_modes"] = list(e["allowed_modes"])
+            for k, v in e.items():
+                e[k] = _interned(v)
+            e["nodes"] = [key[0], key[1]]
+            e["_key"] = key
+            e["_label"] = _format_edge_label(e)
+            edges[key] = e
         return cls(nodes=nodes, edges=list(edges.values()))
 
+    def to_dict(self) -> Dict[str, Any]:
+        serial_nodes = [{"id": nid, **attrs} for nid, attrs in self.nodes.items()]
+        serial_edges = [{k: v for k, v in e.items() if k not in CACHED_EDGE_FIELDS} for e in self.edges]
+        return {"nodes": serial_nodes, "edges": serial_edges}
+
     def save(self, path: Path) -> None:
-        serial_nodes = [{"id": nid, **attrs} for nid, attrs in sorted(self.nodes.items())]
-        serial_edges = list(self.edges)
-        payload = {"nodes": serial_nodes, "edges": serial_edges}
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, sort_keys=False)
+        _dump_payload(path, self.to_dict())
 
     def ensure_node(self, node_id: str) -> None:
         if node_id not in self.nodes:
@@ -78,27 +212,37 @@ class GraphData:
     def remove_node(self, node_id: str) -> None:
         if node_id in self.nodes:
             del self.nodes[node_id]
-        self.edges = [e for e in self.edges if node_id not in e.get("nodes", [])]
+        for key in self._adj.pop(node_id, set()):
+            self._remove_edge_by_key(key)
 
     def find_edge_index(self, a: str, b: str) -> Optional[int]:
-        key = tuple(sorted((a, b)))
-        for idx, e in enumerate(self.edges):
-            if tuple(sorted(e.get("nodes", []))) == key:
-                return idx
-        return None
+        return self._edge_index.get(_canon(a, b))
 
     def upsert_edge(self, a: str, b: str, attrs: Dict[str, Any]) -> None:
-        key = tuple(sorted((a, b)))
-        edge = {"nodes": [key[0], key[1]], **attrs}
-        existing_idx = self.find_edge_index(a, b)
+        key = _canon(a, b)
+        edge = {"nodes": [key[0], key[1]], **attrs, "_key": key}
+        edge["_label"] = _format_edge_label(edge)
+        existing_idx = self._edge_index.get(key)
         if existing_idx is not None:
             self.edges[existing_idx] = edge
         else:
             self.edges.append(edge)
+            self._edge_index[key] = len(self.edges) - 1
+            self._link(key)
 
     def remove_edge(self, a: str, b: str) -> None:
-        key = tuple(sorted((a, b)))
-        self.edges = [e for e in self.edges if tuple(sorted(e.get("nodes", []))) != key]
+        self._remove_edge_by_key(_canon(a, b))
+
+    def _remove_edge_by_key(self, key: EdgeKey) -> None:
+        # Swap-pop: move the last edge into the freed slot instead of rebuilding the list.
+        idx = self._edge_index.pop(key, None)
+        if idx is None:
+            return
+        self._unlink(key)
+        last = self.edges.pop()
+        if idx < len(self.edges):
+            self.edges[idx] = last
+            self._edge_index[last["_key"]] = idx
 
 
 class GraphEditorApp(tk.Tk):
@@ -110,6 +254,8 @@ class GraphEditorApp(tk.Tk):
         self.resizable(True, True)
 
         self.graph_path = initial_path
+        # File I/O runs on one worker thread so large saves/loads don't freeze the UI.
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
         try:
             self.graph = GraphData.load(initial_path)
         except FileNotFoundError:
@@ -119,8 +265,11 @@ class GraphEditorApp(tk.Tk):
             self.graph = GraphData.empty()
 
         self.selected_node: str | None = None
-        self.edge_selection_map: List[int] = []
+        # Edge list rows line up with graph.edges, so a row index is an edge index.
         self.selected_edge_index: int | None = None
+        # Sorted node ids shared by the node list and both endpoint combos; rebuilt
+        # lazily after a reload and patched in place by single-node edits.
+        self._sorted_node_ids: List[str] | None = None
 
         self._build_ui()
         self.refresh_lists()
@@ -136,9 +285,14 @@ class GraphEditorApp(tk.Tk):
         ttk.Label(top, text="Graph file:").grid(row=0, column=0, sticky="w")
         self.path_label = ttk.Label(top, text=str(self.graph_path))
         self.path_label.grid(row=0, column=1, sticky="w")
-        ttk.Button(top, text="Open...", command=self.load_file).grid(row=0, column=2, padx=8)
-        ttk.Button(top, text="Save", command=self.save_file).grid(row=0, column=3)
-        ttk.Button(top, text="Save As...", command=self.save_file_as).grid(row=0, column=4, padx=4)
+        self.io_buttons = [
+            ttk.Button(top, text="Open...", command=self.load_file),
+            ttk.Button(top, text="Save", command=self.save_file),
+            ttk.Button(top, text="Save As...", command=self.save_file_as),
+        ]
+        self.io_buttons[0].grid(row=0, column=2, padx=8)
+        self.io_buttons[1].grid(row=0, column=3)
+        self.io_buttons[2].grid(row=0, column=4, padx=4)
 
         body = ttk.Frame(self, padding=10)
         body.pack(fill="both", expand=True)
@@ -226,35 +380,78 @@ class GraphEditorApp(tk.Tk):
     def set_status(self, text: str) -> None:
         self.status_var.set(text)
 
+    def destroy(self) -> None:
+        # Let a pending save finish before the process exits.
+        self._io_pool.shutdown(wait=True)
+        super().destroy()
+
+    def _submit_io(self, status: str, on_done: Callable[[Future], None], fn: Callable[..., Any], *args: Any) -> None:
+        for button in self.io_buttons:
+            button.state(["disabled"])
+        self.set_status(status)
+        future = self._io_pool.submit(fn, *args)
+        self.after(IO_POLL_MS, self._poll_io, future, on_done)
+
+    def _poll_io(self, future: Future, on_done: Callable[[Future], None]) -> None:
+        if not future.done():
+            self.after(IO_POLL_MS, self._poll_io, future, on_done)
+            return
+        for button in self.io_buttons:
+            button.state(["!disabled"])
+        on_done(future)
+
+    def sorted_node_ids(self) -> List[str]:
+        if self._sorted_node_ids is None:
+            self._sorted_node_ids = sorted(self.graph.nodes)
+        return self._sorted_node_ids
+
+    def invalidate_node_ids(self) -> None:
+        self._sorted_node_ids = None
+
     def load_file(self) -> None:
         path_str = filedialog.askopenfilename(
             title="Open graph JSON",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            filetypes=GRAPH_FILETYPES,
         )
         if not path_str:
             return
         path = Path(path_str)
-        try:
-            self.graph = GraphData.load(path)
+
+        def on_loaded(future: Future) -> None:
+            try:
+                self.graph = future.result()
+            except Exception as exc:
+                self.set_status("Ready")
+                messagebox.showerror("Load error", f"Could not load graph: {exc}")
+                return
+            self.invalidate_node_ids()
             self.graph_path = path
             self.path_label.config(text=str(path))
             self.set_status(f"Loaded {path}")
             self.refresh_lists()
-        except Exception as exc:
-            messagebox.showerror("Load error", f"Could not load graph: {exc}")
+
+        self._submit_io(f"Loading {path}...", on_loaded, GraphData.load, path)
 
     def save_file(self) -> None:
-        try:
-            self.graph.save(self.graph_path)
-            self.set_status(f"Saved to {self.graph_path}")
-        except Exception as exc:
-            messagebox.showerror("Save error", str(exc))
+        path = self.graph_path
+
+        def on_saved(future: Future) -> None:
+            try:
+                future.result()
+            except Exception as exc:
+                self.set_status("Ready")
+                messagebox.showerror("Save error", str(exc))
+                return
+            self.set_status(f"Saved to {path}")
+
+        # Snapshot on the Tk thread; only serialization and the write happen in the background.
+        self._submit_io(f"Saving to {path}...", on_saved, _dump_payload, path, self.graph.to_dict())
 
     def save_file_as(self) -> None:
         path_str = filedialog.asksaveasfilename(
             title="Save graph JSON",
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            filetypes=GRAPH_FILETYPES,
         )
         if not path_str:
             return
@@ -262,34 +459,74 @@ class GraphEditorApp(tk.Tk):
         self.path_label.config(text=str(self.graph_path))
         self.save_file()
 
+    def _node_label(self, node_id: str) -> str:
+        return node_id + " (port)" if self.graph.nodes[node_id].get("is_port") else node_id
+
     def refresh_lists(self) -> None:
-        # Nodes
+        """Rebuild both lists and clear the forms; used after loading a graph."""
+        # Labels are built in Python first so each list box needs a single Tk insert call.
+        node_ids = self.sorted_node_ids()
         self.nodes_list.delete(0, tk.END)
-        for nid in sorted(self.graph.nodes):
-            suffix = " (port)" if self.graph.nodes.get(nid, {}).get("is_port") else ""
-            self.nodes_list.insert(tk.END, nid + suffix)
-
-        # Edges
+        if node_ids:
+            self.nodes_list.insert(tk.END, *(self._node_label(nid) for nid in node_ids))
+        self._reload_edges_list()
+        self._update_endpoint_choices()
+        self._reset_node_form()
+        self._reset_edge_form()
+
+    def _reload_edges_list(self) -> None:
         self.edges_list.delete(0, tk.END)
-        self.edge_selection_map = []
-        for idx, edge in enumerate(self.graph.edges):
-            a, b = edge["nodes"]
-            rtypes = edge.get("route_types") or []
-            rtype = ", ".join(rtypes) if rtypes else edge.get("route_type", "route")
-            dist = edge.get("approx_distance_km")
-            label = f"{a} — {b} ({rtype}"
-            if dist is not None:
-                label += f", {dist} km"
-            label += ")"
-            self.edges_list.insert(tk.END, label)
-            self.edge_selection_map.append(idx)
-
-        node_ids = sorted(self.graph.nodes.keys())
+        if self.graph.edges:
+            self.edges_list.insert(tk.END, *(edge["_label"] for edge in self.graph.edges))
+
+    def _update_endpoint_choices(self) -> None:
+        node_ids = self.sorted_node_ids()
         self.edge_a_combo["values"] = node_ids
         self.edge_b_combo["values"] = node_ids
 
+    # Incremental updates: each edit touches only the affected list rows.
+
+    def _on_node_added(self, node_id: str) -> None:
+        node_ids = self.sorted_node_ids()
+        pos = bisect.bisect_left(node_ids, node_id)
+        node_ids.insert(pos, node_id)
+        self.nodes_list.insert(pos, self._node_label(node_id))
+        self._update_endpoint_choices()
+
+    def _on_node_changed(self, node_id: str) -> None:
+        pos = bisect.bisect_left(self.sorted_node_ids(), node_id)
+        self.nodes_list.delete(pos)
+        self.nodes_list.insert(pos, self._node_label(node_id))
+
+    def _on_node_removed(self, node_id: str) -> None:
+        node_ids = self.sorted_node_ids()
+        pos = bisect.bisect_left(node_ids, node_id)
+        del node_ids[pos]
+        self.nodes_list.delete(pos)
+        self._update_endpoint_choices()
+        # Several edges may have been swap-removed; rebuild that list in one call.
+        self._reload_edges_list()
+
+    def _on_edge_saved(self, idx: int | None) -> None:
+        if idx is None:
+            self.edges_list.insert(tk.END, self.graph.edges[-1]["_label"])
+        else:
+            self.edges_list.delete(idx)
+            self.edges_list.insert(idx, self.graph.edges[idx]["_label"])
+
+    def _on_edge_removed(self, idx: int) -> None:
+        # Mirror GraphData's swap-pop: the last row moves into the removed slot.
+        self.edges_list.delete(len(self.graph.edges))
+        if idx < len(self.graph.edges):
+            self.edges_list.delete(idx)
+            self.edges_list.insert(idx, self.graph.edges[idx]["_label"])
+
+    def _reset_node_form(self) -> None:
         self.node_id_var.set("")
         self.node_port_var.set(False)
+        self.selected_node = None
+
+    def _reset_edge_form(self) -> None:
         self.edge_a_var.set("")
         self.edge_b_var.set("")
         self.edge_undirected_var.set(True)
@@ -298,7 +535,6 @@ class GraphEditorApp(tk.Tk):
             var.set(False)
         for var in self.mode_vars.values():
             var.set(False)
-        self.selected_node = None
         self.selected_edge_index = None
 
     def on_node_select(self, event: tk.Event) -> None:
@@ -317,8 +553,7 @@ class GraphEditorApp(tk.Tk):
         selection = self.edges_list.curselection()
         if not selection:
             return
-        list_idx = selection[0]
-        edge_idx = self.edge_selection_map[list_idx]
+        edge_idx = selection[0]
         self.selected_edge_index = edge_idx
         edge = self.graph.edges[edge_idx]
         a, b = edge["nodes"]
@@ -328,12 +563,14 @@ class GraphEditorApp(tk.Tk):
         route_types = edge.get("route_types")
         if route_types is None:
             route_types = [edge.get("route_type")] if edge.get("route_type") else []
+        rt_set = frozenset(route_types)
         for rt, var in self.route_type_vars.items():
-            var.set(rt in route_types)
+            var.set(rt in rt_set)
         dist = edge.get("approx_distance_km") or edge.get("distance_km") or ""
         self.distance_var.set(str(dist))
+        mode_set = frozenset(edge.get("allowed_modes") or ())
         for mode, var in self.mode_vars.items():
-            var.set(mode in (edge.get("allowed_modes") or []))
+            var.set(mode in mode_set)
 
     def save_node(self) -> None:
         node_id = self.node_id_var.get().strip()
@@ -343,9 +580,13 @@ class GraphEditorApp(tk.Tk):
         existing = self.graph.nodes.get(node_id, {})
         attrs = dict(existing)
         attrs["is_port"] = bool(self.node_port_var.get())
+        is_new = node_id not in self.graph.nodes
         self.graph.add_node(node_id, attrs)
+        if is_new:
+            self._on_node_added(node_id)
+        else:
+            self._on_node_changed(node_id)
         self.set_status(f"Saved node {node_id}")
-        self.refresh_lists()
 
     def delete_node(self) -> None:
         node_id = self.node_id_var.get().strip() or self.selected_node
@@ -358,8 +599,10 @@ class GraphEditorApp(tk.Tk):
         if not messagebox.askyesno("Confirm", f"Remove node '{node_id}' and connected edges?"):
             return
         self.graph.remove_node(node_id)
+        self._on_node_removed(node_id)
+        self._reset_node_form()
+        self._reset_edge_form()
         self.set_status(f"Removed node {node_id}")
-        self.refresh_lists()
 
     def save_edge(self) -> None:
         a = self.edge_a_var.get().strip()
@@ -373,10 +616,14 @@ class GraphEditorApp(tk.Tk):
         existing_idx = self.graph.find_edge_index(a, b)
         existing_attrs: Dict[str, Any] = {}
         if existing_idx is not None:
-            existing_attrs = {k: v for k, v in self.graph.edges[existing_idx].items() if k != "nodes"}
+            existing_attrs = {
+                k: v
+                for k, v in self.graph.edges[existing_idx].items()
+                if k != "nodes" and k not in CACHED_EDGE_FIELDS
+            }
         attrs = dict(existing_attrs)
         attrs["undirected"] = bool(self.edge_undirected_var.get())
-        selected_rtypes = [rt for rt, var in self.route_type_vars.items() if var.get()]
+        selected_rtypes = [rt for rt in ROUTE_TYPES if self.route_type_vars[rt].get()]
         if selected_rtypes:
             attrs["route_types"] = selected_rtypes
             attrs["route_type"] = selected_rtypes[0]  # keep primary for compatibility
@@ -390,17 +637,19 @@ class GraphEditorApp(tk.Tk):
             return
         if distance_val is not None:
             attrs["approx_distance_km"] = distance_val
-        allowed = [mode for mode, var in self.mode_vars.items() if var.get()]
+        allowed = [mode for mode in ALLOWED_MODES if self.mode_vars[mode].get()]
         attrs["allowed_modes"] = allowed
 
         if a not in self.graph.nodes or b not in self.graph.nodes:
             if not messagebox.askyesno("Create nodes?", "One or both endpoints do not exist. Create them?"):
                 return
-            self.graph.ensure_node(a)
-            self.graph.ensure_node(b)
+            for node_id in (a, b):
+                if node_id not in self.graph.nodes:
+                    self.graph.ensure_node(node_id)
+                    self._on_node_added(node_id)
         self.graph.upsert_edge(a, b, attrs)
+        self._on_edge_saved(existing_idx)
         self.set_status(f"Saved edge {a} — {b}")
-        self.refresh_lists()
 
     def delete_edge(self) -> None:
         a = self.edge_a_var.get().strip()
@@ -411,9 +660,14 @@ class GraphEditorApp(tk.Tk):
         if not a or not b:
             messagebox.showwarning("No edge selected", "Select an edge to remove.")
             return
+        idx = self.graph.find_edge_index(a, b)
+        if idx is None:
+            messagebox.showwarning("Edge missing", "Edge not found in graph.")
+            return
         self.graph.remove_edge(a, b)
+        self._on_edge_removed(idx)
+        self._reset_edge_form()
         self.set_status(f"Removed edge {a} — {b}")
-        self.refresh_lists()
 
 
 def parse_args() -> argparse.Namespace:
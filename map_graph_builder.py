@@ -16,34 +16,98 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import sys
 import tkinter as tk
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog, ttk
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 
+# Largest image side shown on the canvas; bigger maps are downscaled for display only.
+MAX_IMAGE_DIM = 4096
+# With Pillow, graphs with at least this many edges have them painted into the background image.
+RASTER_EDGE_THRESHOLD = 2000
+
 try:
-    from PIL import Image, ImageTk  # type: ignore
+    from PIL import Image, ImageDraw, ImageTk  # type: ignore
 
-    def load_image(path: Path) -> tk.PhotoImage:
+    def load_image(path: Path, max_dim: int = MAX_IMAGE_DIM) -> Tuple[tk.PhotoImage, float, Any]:
+        """Load the map for display: (photo, original pixels per displayed pixel, PIL image)."""
         img = Image.open(path)
-        return ImageTk.PhotoImage(img)
+        width = img.width
+        if img.width > max_dim or img.height > max_dim:
+            img.thumbnail((max_dim, max_dim), Image.LANCZOS)
+        return ImageTk.PhotoImage(img), width / img.width, img
 
     IMAGE_HELP = "Uses Pillow to load images (JPEG/PNG/etc.)."
 except Exception:
     Image = None
+    ImageDraw = None
     ImageTk = None
 
-    def load_image(path: Path) -> tk.PhotoImage:
+    def load_image(path: Path, max_dim: int = MAX_IMAGE_DIM) -> Tuple[tk.PhotoImage, float, Any]:
         # Tk PhotoImage supports PNG/GIF/PPM; JPEG may fail without Pillow.
-        return tk.PhotoImage(file=str(path))
+        photo = tk.PhotoImage(file=str(path))
+        # Without Pillow only whole-number subsampling is available.
+        factor = -(-max(photo.width(), photo.height()) // max_dim)
+        if factor > 1:
+            photo = photo.subsample(factor)
+        return photo, float(max(factor, 1)), None
 
     IMAGE_HELP = "Pillow not available; Tk may only load PNG/GIF. Install Pillow for JPEG support."
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
+
+
+# Side of the square cells used to bucket nodes for click hit-testing.
+GRID_CELL = 20.0
+# Edge fields derived from node positions and scale; kept on Edge, written on save.
+DERIVED_EDGE_ATTRS = frozenset({"approx_distance_km", "pixel_distance"})
+# Extra pixels around the visible area in which items are still drawn (labels, ovals).
+VIEW_MARGIN = 20.0
+
+
+def _canon(a: str, b: str) -> Tuple[str, str]:
+    """Edge key for an undirected pair: endpoints in sorted order, no list allocation."""
+    return (a, b) if a <= b else (b, a)
+
+
+def _intern_id(node_id: Any) -> Any:
+    """Intern string node ids so node keys, edge keys and Edge endpoints share one object."""
+    return sys.intern(node_id) if isinstance(node_id, str) else node_id
+
+
+def _segment_dist2(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    """Squared shortest distance from point P to segment AB."""
+    # Project P onto AB and clamp the projection parameter to [0, 1] (0 -> A, 1 -> B).
+    vx, vy = x2 - x1, y2 - y1
+    c2 = vx * vx + vy * vy
+    t = ((px - x1) * vx + (py - y1) * vy) / c2 if c2 > 0 else 0.0
+    t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+    dx = px - (x1 + t * vx)
+    dy = py - (y1 + t * vy)
+    return dx * dx + dy * dy
+
+
+if njit is not None:
+    # Compiled on first import and cached on disk, so later runs skip the JIT cost.
+    _segment_dist2 = njit("f8(f8,f8,f8,f8,f8,f8)", fastmath=True, cache=True)(_segment_dist2)
+
 
 @dataclass
 class Node:
+    # Explicit slots (no per-instance __dict__) keep large graphs small on any Python 3.
+    __slots__ = ("node_id", "x", "y", "attrs")
     node_id: str
     x: float
     y: float
@@ -52,11 +116,12 @@ class Node:
 
 @dataclass
 class Edge:
+    __slots__ = ("a", "b", "pixel_distance", "distance", "attrs")
     a: str
     b: str
     pixel_distance: float
     distance: float  # scaled (e.g., km)
-    attrs: Dict[str, Any]
+    attrs: Dict[str, Any]  # user metadata only; distances live in the fields above
 
 
 class GraphState:
@@ -64,37 +129,133 @@ class GraphState:
         self.nodes: Dict[str, Node] = {}
         self.edges: Dict[Tuple[str, str], Edge] = {}
         self.scale = scale  # distance units per pixel
+        # Uniform grid of node ids keyed by (x // GRID_CELL, y // GRID_CELL).
+        self._grid: Dict[Tuple[int, int], List[str]] = {}
+        # Edges whose endpoints moved since their pixel distance was measured.
+        self._dirty: Set[Tuple[str, str]] = set()
+        # Incident edge keys per node, so removing or moving a node doesn't scan every edge.
+        self._adj: Dict[str, Set[Tuple[str, str]]] = {}
+        # Bumped whenever node positions, edges or edge distances change.
+        self.version = 0
+
+    @staticmethod
+    def _cell(x: float, y: float) -> Tuple[int, int]:
+        return int(x // GRID_CELL), int(y // GRID_CELL)
 
     def add_node(self, node_id: str, x: float, y: float, attrs: Optional[Dict[str, Any]] = None) -> None:
+        node_id = _intern_id(node_id)
+        self.version += 1
+        if node_id in self.nodes:
+            self._grid_discard(self.nodes[node_id])
+            self._dirty.update(self._adj.get(node_id, ()))
         self.nodes[node_id] = Node(node_id, x, y, attrs or {})
+        self._grid.setdefault(self._cell(x, y), []).append(node_id)
+
+    def _grid_discard(self, node: Node) -> None:
+        cell = self._cell(node.x, node.y)
+        bucket = self._grid.get(cell)
+        if bucket is not None:
+            bucket.remove(node.node_id)
+            if not bucket:
+                del self._grid[cell]
+
+    def nodes_near(self, x: float, y: float, radius: float) -> List[str]:
+        """Ids of nodes in grid cells that may lie within `radius` of (x, y)."""
+        cx, cy = self._cell(x, y)
+        reach = int(radius // GRID_CELL) + 1
+        found: List[str] = []
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                bucket = self._grid.get((gx, gy))
+                if bucket:
+                    found.extend(bucket)
+        return found
 
     def remove_node(self, node_id: str) -> None:
+        self.version += 1
         if node_id in self.nodes:
-            del self.nodes[node_id]
-        to_delete = [k for k in self.edges if node_id in k]
-        for k in to_delete:
-            del self.edges[k]
-
-    def upsert_edge(self, a: str, b: str, attrs: Optional[Dict[str, Any]] = None) -> Edge:
-        key = tuple(sorted((a, b)))
-        node_a = self.nodes[a]
-        node_b = self.nodes[b]
-        pixel_d = math.hypot(node_a.x - node_b.x, node_a.y - node_b.y)
+            self._grid_discard(self.nodes.pop(node_id))
+        for key in self._adj.pop(node_id, set()):
+            del self.edges[key]
+            self._unlink(key)
+
+    def remove_edge(self, a: str, b: str) -> None:
+        key = _canon(a, b)
+        if self.edges.pop(key, None) is not None:
+            self._unlink(key)
+            self.version += 1
+
+    def _unlink(self, key: Tuple[str, str]) -> None:
+        for end in key:
+            keys = self._adj.get(end)
+            if keys is not None:
+                keys.discard(key)
+
+    def upsert_edge(
+        self,
+        a: str,
+        b: str,
+        attrs: Optional[Dict[str, Any]] = None,
+        pixel_distance: Optional[float] = None,
+    ) -> Edge:
+        """Create or update edge a-b; `pixel_distance` skips measuring when it is already known."""
+        a = _intern_id(a)
+        b = _intern_id(b)
+        key = _canon(a, b)
+        if pixel_distance is None:
+            node_a = self.nodes[a]
+            node_b = self.nodes[b]
+            pixel_d = math.hypot(node_a.x - node_b.x, node_a.y - node_b.y)
+        else:
+            pixel_d = pixel_distance
         dist = pixel_d * self.scale
-        existing_attrs = self.edges.get(key).attrs if key in self.edges else {}
-        combined_attrs = dict(existing_attrs)
+        self.version += 1
+        edge = self.edges.get(key)
+        if edge is None:
+            edge = Edge(a=key[0], b=key[1], pixel_distance=pixel_d, distance=dist, attrs={})
+            self.edges[key] = edge
+            self._adj.setdefault(key[0], set()).add(key)
+            self._adj.setdefault(key[1], set()).add(key)
+        else:
+            # Existing edges are updated in place rather than rebuilt and re-stored.
+            edge.pixel_distance = pixel_d
+            edge.distance = dist
         if attrs:
-            combined_attrs.update(attrs)
-        combined_attrs["approx_distance_km"] = round(dist, 2)
-        combined_attrs["pixel_distance"] = round(pixel_d, 2)
-        edge = Edge(a=key[0], b=key[1], pixel_distance=pixel_d, distance=dist, attrs=combined_attrs)
-        self.edges[key] = edge
+            edge.attrs.update(attrs)
+            for k in DERIVED_EDGE_ATTRS:
+                edge.attrs.pop(k, None)
         return edge
 
+    def set_scale(self, scale: float) -> None:
+        """Change units per pixel; pixel distances are reused, only moved edges are re-measured."""
+        self.scale = scale
+        self.version += 1
+        self.refresh_dirty()
+        for edge in self.edges.values():
+            edge.distance = edge.pixel_distance * scale
+
+    def refresh_dirty(self) -> None:
+        dirty = [self.edges[k] for k in self._dirty if k in self.edges]
+        self._dirty.clear()
+        self._remeasure(dirty)
+
     def recalc_edges(self) -> None:
-        for k in list(self.edges.keys()):
-            a, b = k
-            self.upsert_edge(a, b, self.edges[k].attrs)
+        """Re-measure every edge from its endpoints' current positions."""
+        self._dirty.clear()
+        self._remeasure(self.edges.values())
+
+    def _remeasure(self, edges: Iterable[Edge]) -> None:
+        # One pass that updates the Edge objects in place.
+        self.version += 1
+        nodes = self.nodes
+        scale = self.scale
+        hypot = math.hypot
+        for edge in edges:
+            node_a = nodes[edge.a]
+            node_b = nodes[edge.b]
+            pixel_d = hypot(node_a.x - node_b.x, node_a.y - node_b.y)
+            edge.pixel_distance = pixel_d
+            edge.distance = pixel_d * scale
 
     def to_json(self) -> Dict[str, Any]:
         nodes_data = [
@@ -105,6 +266,8 @@ class GraphState:
             {
                 "nodes": [e.a, e.b],
                 **e.attrs,
+                "approx_distance_km": round(e.distance, 2),
+                "pixel_distance": round(e.pixel_distance, 2),
             }
             for e in self.edges.values()
         ]
@@ -122,10 +285,16 @@ class GraphState:
             if "nodes" not in edge or len(edge["nodes"]) != 2:
                 continue
             a, b = edge["nodes"]
-            gs.nodes.setdefault(a, Node(a, 0, 0, {}))
-            gs.nodes.setdefault(b, Node(b, 0, 0, {}))
+            for nid in (a, b):
+                if nid not in gs.nodes:
+                    gs.add_node(nid, 0, 0)
             attrs = {k: v for k, v in edge.items() if k != "nodes"}
-            gs.upsert_edge(a, b, attrs)
+            # Saved files carry the measured pixel distance; only measure edges without one.
+            pixel_d = edge.get("pixel_distance")
+            if isinstance(pixel_d, (int, float)) and not isinstance(pixel_d, bool):
+                gs.upsert_edge(a, b, attrs, pixel_distance=float(pixel_d))
+            else:
+                gs.upsert_edge(a, b, attrs)
         return gs
 
 
@@ -140,9 +309,21 @@ class MapBuilderApp(tk.Tk):
         self.graph_path = graph_path
         self.mode = tk.StringVar(value="add_node")  # add_node, connect, delete
         self.selected_node: Optional[str] = None
+        # Canvas items per entity so redraw can move items instead of recreating them:
+        # [shape id, text id, drawn coords, drawn distance (edges) or fill color (nodes)].
+        self._edge_items: Dict[Tuple[str, str], List[Any]] = {}
+        self._node_items: Dict[str, List[Any]] = {}
+        self._redraw_pending = False
+        self._in_bulk = False
+        self._view: Dict[str, Tuple[str, str]] = {}
+        # Map image with the edges painted in, used instead of edge items on large graphs,
+        # and the state.version it was painted at; scrolling and selection reuse it.
+        self._edge_layer: Optional[tk.PhotoImage] = None
+        self._edge_layer_version = -1
 
         try:
-            self.photo = load_image(image_path)
+            # Node positions stay in original image pixels; img_scale converts to the display.
+            self.photo, self.img_scale, self._map_image = load_image(image_path)
         except Exception as exc:
             messagebox.showerror("Image load error", f"Could not load image {image_path}.\n{exc}\n{IMAGE_HELP}")
             raise SystemExit(1)
@@ -157,7 +338,7 @@ class MapBuilderApp(tk.Tk):
                 messagebox.showwarning("Graph load", f"Could not load graph: {exc}")
 
         self._build_ui()
-        self.redraw()
+        self._schedule_redraw()
 
     def _build_ui(self) -> None:
         top = ttk.Frame(self, padding=10)
@@ -192,8 +373,8 @@ class MapBuilderApp(tk.Tk):
             bg="white",
             highlightthickness=1,
             highlightbackground="#888",
-            xscrollcommand=x_scroll.set,
-            yscrollcommand=y_scroll.set,
+            xscrollcommand=lambda first, last: self._on_view_change("x", x_scroll, first, last),
+            yscrollcommand=lambda first, last: self._on_view_change("y", y_scroll, first, last),
         )
         x_scroll.config(command=self.canvas.xview)
         y_scroll.config(command=self.canvas.yview)
@@ -217,9 +398,16 @@ class MapBuilderApp(tk.Tk):
         self.canvas.bind_all("<Button-4>", lambda e: self.canvas.yview_scroll(-2, "units"))  # Linux up
         self.canvas.bind_all("<Button-5>", lambda e: self.canvas.yview_scroll(2, "units"))   # Linux down
 
+    def _on_view_change(self, axis: str, bar: ttk.Scrollbar, first: str, last: str) -> None:
+        # Tk reports every scroll, pan and resize here; redraw to populate the new view.
+        bar.set(first, last)
+        if self._view.get(axis) != (first, last):
+            self._view[axis] = (first, last)
+            self._schedule_redraw()
+
     def on_click(self, event: tk.Event) -> None:
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
+        x = self.canvas.canvasx(event.x) * self.img_scale
+        y = self.canvas.canvasy(event.y) * self.img_scale
         mode = self.mode.get()
         if mode == "add_node":
             self.add_node_at(x, y)
@@ -252,11 +440,17 @@ class MapBuilderApp(tk.Tk):
         self.state.add_node(name, x, y)
         self.selected_node = name
         self.status_var.set(f"Added node {name} at ({int(x)}, {int(y)})")
-        self.redraw()
+        self._schedule_redraw()
 
     def find_node_at(self, x: float, y: float, radius: float = 10) -> Optional[str]:
-        for nid, node in self.state.nodes.items():
-            if math.hypot(node.x - x, node.y - y) <= radius:
+        radius *= self.img_scale  # given in screen pixels
+        nodes = self.state.nodes
+        r2 = radius * radius
+        for nid in self.state.nodes_near(x, y, radius):
+            node = nodes[nid]
+            dx = node.x - x
+            dy = node.y - y
+            if dx * dx + dy * dy <= r2:
                 return nid
         return None
 
@@ -268,7 +462,7 @@ class MapBuilderApp(tk.Tk):
         if not self.selected_node:
             self.selected_node = nid
             self.status_var.set(f"Selected start {nid}; click another node to connect.")
-            self.redraw()
+            self._schedule_redraw()
             return
         if nid == self.selected_node:
             self.status_var.set("Choose a different node to connect.")
@@ -278,7 +472,7 @@ class MapBuilderApp(tk.Tk):
             f"Connected {edge.a} — {edge.b} | {edge.pixel_distance:.1f}px → {edge.distance:.2f} units"
         )
         self.selected_node = None
-        self.redraw()
+        self._schedule_redraw()
 
     def delete_at(self, x: float, y: float) -> None:
         # Remove node if clicked near one; otherwise remove nearest edge if within threshold.
@@ -287,45 +481,45 @@ class MapBuilderApp(tk.Tk):
             self.state.remove_node(nid)
             self.status_var.set(f"Removed node {nid} (and connected edges).")
             self.selected_node = None
-            self.redraw()
+            self._schedule_redraw()
             return
         edge_key = self.find_edge_near(x, y)
         if edge_key:
             a, b = edge_key
-            del self.state.edges[edge_key]
+            self.state.remove_edge(a, b)
             self.status_var.set(f"Removed edge {a} — {b}.")
-            self.redraw()
+            self._schedule_redraw()
         else:
             self.status_var.set("Nothing to delete here; click closer to a node or edge.")
 
     def find_edge_near(self, x: float, y: float, threshold: float = 8.0) -> Optional[Tuple[str, str]]:
         best: Optional[Tuple[str, str]] = None
-        best_d = threshold
+        best_d = threshold * self.img_scale  # given in screen pixels
+        best_d2 = best_d * best_d
+        nodes = self.state.nodes
         for (a, b), edge in self.state.edges.items():
-            n1 = self.state.nodes.get(a)
-            n2 = self.state.nodes.get(b)
+            n1 = nodes.get(a)
+            n2 = nodes.get(b)
             if not n1 or not n2:
                 continue
-            d = self.point_to_segment_dist(x, y, n1.x, n1.y, n2.x, n2.y)
-            if d <= best_d:
-                best_d = d
+            x1, y1, x2, y2 = n1.x, n1.y, n2.x, n2.y
+            # Skip segments whose bounding box, grown by the current best distance,
+            # doesn't contain the click; most edges are rejected here.
+            if (x1 if x1 < x2 else x2) - best_d > x or (x1 if x1 > x2 else x2) + best_d < x:
+                continue
+            if (y1 if y1 < y2 else y2) - best_d > y or (y1 if y1 > y2 else y2) + best_d < y:
+                continue
+            # Compare squared distances; the root is only needed to tighten the box test.
+            d2 = _segment_dist2(x, y, x1, y1, x2, y2)
+            if d2 <= best_d2:
+                best_d2 = d2
+                best_d = math.sqrt(d2)
                 best = (a, b)
         return best
 
     @staticmethod
     def point_to_segment_dist(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
-        # Compute shortest distance from point P to segment AB.
-        vx, vy = x2 - x1, y2 - y1
-        wx, wy = px - x1, py - y1
-        c1 = vx * wx + vy * wy
-        if c1 <= 0:
-            return math.hypot(px - x1, py - y1)
-        c2 = vx * vx + vy * vy
-        if c2 <= c1:
-            return math.hypot(px - x2, py - y2)
-        b = c1 / c2
-        bx, by = x1 + b * vx, y1 + b * vy
-        return math.hypot(px - bx, py - by)
+        return math.sqrt(_segment_dist2(px, py, x1, y1, x2, y2))
 
     def apply_scale(self) -> None:
         try:
@@ -335,12 +529,13 @@ class MapBuilderApp(tk.Tk):
         except Exception:
             messagebox.showerror("Invalid scale", "Scale must be a positive number (units per pixel).")
             return
-        self.state.scale = scale
-        self.recalc_edges()
+        with self._bulk_update():
+            self.state.set_scale(scale)
+        self.status_var.set("Applied new scale to edge distances.")
 
     def recalc_edges(self) -> None:
-        self.state.recalc_edges()
-        self.redraw()
+        with self._bulk_update():
+            self.state.recalc_edges()
         self.status_var.set("Recalculated edge distances with new scale.")
 
     def save_graph(self) -> None:
@@ -362,48 +557,153 @@ class MapBuilderApp(tk.Tk):
     def _save_to_path(self, path: Path) -> None:
         data = self.state.to_json()
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with path.open("w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
         self.status_var.set(f"Saved graph to {path}")
 
+    @contextmanager
+    def _bulk_update(self) -> Iterator[None]:
+        """Hold back redraws during a batch of changes, then draw and flush the canvas once."""
+        self._in_bulk = True
+        try:
+            yield
+        finally:
+            self._in_bulk = False
+        self.redraw()
+        self.canvas.update_idletasks()
+
+    def _schedule_redraw(self) -> None:
+        # Coalesce bursts of changes into a single redraw once Tk is idle.
+        if not self._redraw_pending and not self._in_bulk:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        self._redraw_pending = False
+        self.redraw()
+
     def redraw(self) -> None:
-        self.canvas.delete("node")
-        self.canvas.delete("edge")
-        # Recreate background image to keep it on bottom
-        self.canvas.itemconfig(self.canvas_img, image=self.photo)
-        self.canvas.config(scrollregion=(0, 0, self.photo.width(), self.photo.height()))
-        # Draw edges
-        for edge in self.state.edges.values():
-            a = self.state.nodes.get(edge.a)
-            b = self.state.nodes.get(edge.b)
+        canvas = self.canvas
+        raster = self._map_image is not None and len(self.state.edges) >= RASTER_EDGE_THRESHOLD
+        if raster:
+            if self._edge_layer is None or self._edge_layer_version != self.state.version:
+                self._edge_layer = self._paint_edges()
+                self._edge_layer_version = self.state.version
+                canvas.itemconfig(self.canvas_img, image=self._edge_layer)
+        elif self._edge_layer is not None:
+            self._edge_layer = None
+            canvas.itemconfig(self.canvas_img, image=self.photo)
+        # Only entities near the visible part of the map get canvas items.
+        width, height = self.photo.width(), self.photo.height()
+        vx0, vx1 = canvas.xview()
+        vy0, vy1 = canvas.yview()
+        # Bounds are in map coordinates; canvas coordinates are those divided by img_scale.
+        s = self.img_scale
+        inv = 1.0 / s
+        left, right = (vx0 * width - VIEW_MARGIN) * s, (vx1 * width + VIEW_MARGIN) * s
+        top, bottom = (vy0 * height - VIEW_MARGIN) * s, (vy1 * height + VIEW_MARGIN) * s
+        nodes = self.state.nodes
+        created = False
+        # Edges: move the items we already have, create new ones, drop departed ones.
+        # Painted edges need no items, so every cached one is dropped.
+        live_edges: Set[Tuple[str, str]] = set()
+        drawn_edges = () if raster else self.state.edges.items()
+        for key, edge in drawn_edges:
+            a = nodes.get(edge.a)
+            b = nodes.get(edge.b)
             if not a or not b:
                 continue
-            midx = (a.x + b.x) / 2
-            midy = (a.y + b.y) / 2
-            self.canvas.create_line(a.x, a.y, b.x, b.y, fill="#2c6", width=2, tags="edge")
-            self.canvas.create_text(
-                midx,
-                midy,
-                text=f"{edge.distance:.1f}",
-                fill="#104",
-                font=("Arial", 9, "bold"),
-                tags="edge",
-            )
-        # Draw nodes
-        for nid, node in self.state.nodes.items():
-            r = 6
+            if (a.x if a.x > b.x else b.x) < left or (a.x if a.x < b.x else b.x) > right:
+                continue
+            if (a.y if a.y > b.y else b.y) < top or (a.y if a.y < b.y else b.y) > bottom:
+                continue
+            live_edges.add(key)
+            # Integer coordinates are cheaper for Tk to marshal than floats.
+            ax, ay, bx, by = int(a.x * inv), int(a.y * inv), int(b.x * inv), int(b.y * inv)
+            coords = (ax, ay, bx, by)
+            item = self._edge_items.get(key)
+            if item is None:
+                line_id = canvas.create_line(ax, ay, bx, by, fill="#2c6", width=2, tags="edge")
+                text_id = canvas.create_text(
+                    (ax + bx) // 2,
+                    (ay + by) // 2,
+                    text=f"{edge.distance:.1f}",
+                    fill="#104",
+                    font=("Arial", 9, "bold"),
+                    tags="edge",
+                )
+                self._edge_items[key] = [line_id, text_id, coords, edge.distance]
+                created = True
+                continue
+            # Only talk to Tk about what changed since the last redraw.
+            if item[2] != coords:
+                canvas.coords(item[0], ax, ay, bx, by)
+                canvas.coords(item[1], (ax + bx) // 2, (ay + by) // 2)
+                item[2] = coords
+            if item[3] != edge.distance:
+                canvas.itemconfig(item[1], text=f"{edge.distance:.1f}")
+                item[3] = edge.distance
+        for key in [k for k in self._edge_items if k not in live_edges]:
+            canvas.delete(*self._edge_items.pop(key)[:2])
+        # Nodes
+        r = 6
+        live_nodes: Set[str] = set()
+        for nid, node in nodes.items():
+            if not (left <= node.x <= right and top <= node.y <= bottom):
+                continue
+            live_nodes.add(nid)
             color = "#f90" if nid == self.selected_node else "#08c"
-            self.canvas.create_oval(
-                node.x - r,
-                node.y - r,
-                node.x + r,
-                node.y + r,
-                fill=color,
-                outline="white",
-                width=2,
-                tags="node",
-            )
-            self.canvas.create_text(node.x + 12, node.y, text=nid, anchor="w", fill="black", font=("Arial", 10, "bold"), tags="node")
+            x, y = int(node.x * inv), int(node.y * inv)
+            item = self._node_items.get(nid)
+            if item is None:
+                oval_id = canvas.create_oval(
+                    x - r,
+                    y - r,
+                    x + r,
+                    y + r,
+                    fill=color,
+                    outline="white",
+                    width=2,
+                    tags="node",
+                )
+                text_id = canvas.create_text(x + 12, y, text=nid, anchor="w", fill="black", font=("Arial", 10, "bold"), tags="node")
+                self._node_items[nid] = [oval_id, text_id, (x, y), color]
+                created = True
+                continue
+            if item[2] != (x, y):
+                canvas.coords(item[0], x - r, y - r, x + r, y + r)
+                canvas.coords(item[1], x + 12, y)
+                item[2] = (x, y)
+            if item[3] != color:
+                canvas.itemconfig(item[0], fill=color)
+                item[3] = color
+        for nid in [k for k in self._node_items if k not in live_nodes]:
+            canvas.delete(*self._node_items.pop(nid)[:2])
+        if created:
+            # Newly created edges would otherwise sit on top of existing nodes.
+            canvas.tag_raise("node")
+
+    def _paint_edges(self) -> tk.PhotoImage:
+        """Draw every edge and its distance into a copy of the map: one canvas item instead of thousands."""
+        # Painted on a converted copy; the displayed map keeps its own mode (and transparency).
+        src = self._map_image
+        has_alpha = "A" in src.getbands() or "transparency" in src.info
+        img = src.convert("RGBA" if has_alpha else "RGB")
+        draw = ImageDraw.Draw(img)
+        inv = 1.0 / self.img_scale
+        nodes = self.state.nodes
+        for edge in self.state.edges.values():
+            a = nodes.get(edge.a)
+            b = nodes.get(edge.b)
+            if not a or not b:
+                continue
+            ax, ay, bx, by = a.x * inv, a.y * inv, b.x * inv, b.y * inv
+            draw.line((ax, ay, bx, by), fill="#2c6", width=2)
+            draw.text(((ax + bx) / 2, (ay + by) / 2), f"{edge.distance:.1f}", fill="#104")
+        return ImageTk.PhotoImage(img)
 
 
 def parse_args() -> argparse.Namespace:
@@ -10,7 +10,8 @@ Features:
 - On arrival, the next set of routes from the new location becomes selectable.
 - Show a shortest-path roadmap with a time estimate to the destination.
 
-Requires only the Python standard library.
+Requires only the Python standard library; route planning is compiled with numba
+(and numpy) when they are installed.
 """
 from __future__ import annotations
 
@@ -27,6 +28,17 @@ from pathlib import Path
 from tkinter import messagebox, ttk
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    import numpy as np  # type: ignore
+    from numba import njit  # type: ignore
+except Exception:
+    np = None
+    njit = None
 
 SPEEDS_KMH: Dict[str, float] = {
     "foot": 20,
@@ -34,6 +46,8 @@ SPEEDS_KMH: Dict[str, float] = {
     "ship": 60.0,
     "boat": 40.0,
 }
+# SPEEDS_KMH values are in B; converted to km/h once here instead of on every projection.
+MODE_KMH: Dict[str, float] = {mode: speed/10*3.6 for mode, speed in SPEEDS_KMH.items()}
 DEFAULT_ALLOWED_MODES = list(SPEEDS_KMH.keys())
 ROUTE_DIFFICULTY: Dict[str, float] = {
     "road": 1.0,
@@ -45,6 +59,8 @@ ROUTE_DIFFICULTY: Dict[str, float] = {
 
 
 def load_graph(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open(encoding="utf-8") as f:
         return json.load(f)
 
@@ -80,8 +96,12 @@ def prepare_graph(data: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, Any]], Dict
         elif allowed is None:
             edge_attrs["allowed_modes"] = []
 
-        adjacency[a].append((b, edge_attrs.copy()))
-        adjacency[b].append((a, edge_attrs.copy()))
+        # Dijkstra weight, fixed once the edge is loaded.
+        edge_attrs["_weight"] = edge_attrs["approx_distance_km"] * difficulty_for_edge(edge_attrs)
+
+        # Both directions share one attrs dict; treat it as read-only after load.
+        adjacency[a].append((b, edge_attrs))
+        adjacency[b].append((a, edge_attrs))
     return nodes, adjacency
 
 
@@ -89,6 +109,11 @@ def speed_for_mode(mode: str) -> float:
     return SPEEDS_KMH.get(mode, 20)
 
 
+def kmh_for_mode(mode: str) -> float:
+    kmh = MODE_KMH.get(mode)
+    return kmh if kmh is not None else speed_for_mode(mode)/10*3.6
+
+
 def difficulty_for_edge(attrs: Dict[str, Any]) -> float:
     if "difficulty_factor" in attrs:
         return float(attrs["difficulty_factor"])
@@ -100,55 +125,298 @@ def difficulty_for_edge(attrs: Dict[str, Any]) -> float:
     return ROUTE_DIFFICULTY.get(route_type, 1.0)
 
 
+@dataclass
+class RouteIndex:
+    """Adjacency with nodes numbered 0..N-1, so Dijkstra can use lists instead of string-keyed dicts."""
+    ids: List[str]
+    index: Dict[str, int]
+    neighbours: List[List[Tuple[int, float, float]]]  # (neighbour index, edge weight, km) per node
+    csr: Tuple[Any, ...] | None = None  # (indptr, indices, weights, lengths) arrays when numba is available
+    coords: List[Tuple[float, float]] | None = None  # pos_px per node, set when every node has one
+    bound: float = 0.0  # lowest edge weight per pixel; bound * straight-line px never overestimates a route
+
+
+def build_route_index(
+    adjacency: Dict[str, List[Tuple[str, Dict[str, Any]]]],
+    nodes: Dict[str, Dict[str, Any]] | None = None,
+) -> RouteIndex:
+    """Number the graph for shortest_path; pass `nodes` to enable the A* bound from their pos_px."""
+    names = set(adjacency)
+    for routes in adjacency.values():
+        names.update(neigh for neigh, _attrs in routes)
+    # Number nodes in sorted order so heap ties break exactly as they do on the ids themselves.
+    ids = sorted(names)
+    index = {nid: i for i, nid in enumerate(ids)}
+    neighbours = [
+        [(index[neigh], attrs["_weight"], attrs["approx_distance_km"]) for neigh, attrs in adjacency.get(nid, [])]
+        for nid in ids
+    ]
+    # Dijkstra/A* assume no edge makes a route cheaper; difficulty_for_edge accepts any factor.
+    for nid, links in zip(ids, neighbours):
+        for _neigh, weight, _km in links:
+            if weight < 0:
+                raise ValueError(f"Route from {nid} has negative weight {weight}; check its difficulty factor.")
+    csr = None
+    if njit is not None:
+        counts = [len(routes) for routes in neighbours]
+        indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        flat = [route for routes in neighbours for route in routes]
+        indices = np.array([route[0] for route in flat], dtype=np.int64)
+        weights = np.array([route[1] for route in flat], dtype=np.float64)
+        lengths = np.array([route[2] for route in flat], dtype=np.float64)
+        csr = (indptr, indices, weights, lengths)
+
+    coords = None
+    bound = math.inf
+    if nodes and all(len(nodes.get(nid, {}).get("pos_px") or ()) == 2 for nid in ids):
+        coords = [(float(nodes[nid]["pos_px"][0]), float(nodes[nid]["pos_px"][1])) for nid in ids]
+        for i, links in enumerate(neighbours):
+            for j, weight, _km in links:
+                px = math.dist(coords[i], coords[j])
+                if px > 0:
+                    bound = min(bound, weight / px)
+    if coords is None or not 0 < bound < math.inf:
+        coords, bound = None, 0.0
+    return RouteIndex(ids=ids, index=index, neighbours=neighbours, csr=csr, coords=coords, bound=bound)
+
+
+def _dijkstra_csr(
+    indptr: Any, indices: Any, weights: Any, lengths: Any, bound: Any, source: int, target: int
+) -> Tuple[Any, Any, Any]:
+    """Array version of the search loop in shortest_path, compiled with numba when available.
+
+    Uses a 4-ary heap (shallower than a binary one, so fewer sift steps) ordered by
+    (cost + bound, node) like heapq orders tuples. `bound` is the A* lower bound to
+    the target per node; all zeros gives plain Dijkstra.
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    raw = np.zeros(n)
+    prev = np.full(n, -1, dtype=np.int64)
+    heap_cost = np.empty(indices.shape[0] + 1)
+    heap_node = np.empty(indices.shape[0] + 1, dtype=np.int64)
+    dist[source] = 0.0
+    heap_cost[0] = bound[source]
+    heap_node[0] = source
+    size = 1
+    while size > 0:
+        key = heap_cost[0]
+        node = heap_node[0]
+        size -= 1
+        if size > 0:
+            # Move the last entry to the root and sift it down; children of i are 4i+1..4i+4.
+            c = heap_cost[size]
+            v = heap_node[size]
+            i = 0
+            while True:
+                first = 4 * i + 1
+                if first >= size:
+                    break
+                child = first
+                for k in range(first + 1, min(first + 4, size)):
+                    if heap_cost[k] < heap_cost[child] or (
+                        heap_cost[k] == heap_cost[child] and heap_node[k] < heap_node[child]
+                    ):
+                        child = k
+                if heap_cost[child] < c or (heap_cost[child] == c and heap_node[child] < v):
+                    heap_cost[i] = heap_cost[child]
+                    heap_node[i] = heap_node[child]
+                    i = child
+                else:
+                    break
+            heap_cost[i] = c
+            heap_node[i] = v
+        if node == target:
+            break
+        cost = dist[node]
+        if key > cost + bound[node]:
+            continue
+        for e in range(indptr[node], indptr[node + 1]):
+            neigh = indices[e]
+            new_cost = cost + weights[e]
+            if new_cost < dist[neigh]:
+                dist[neigh] = new_cost
+                raw[neigh] = raw[node] + lengths[e]
+                prev[neigh] = node
+                # Push and sift up; grow the heap if it is full.
+                new_key = new_cost + bound[neigh]
+                if size == heap_cost.shape[0]:
+                    grown_cost = np.empty(2 * size)
+                    grown_node = np.empty(2 * size, dtype=np.int64)
+                    grown_cost[:size] = heap_cost
+                    grown_node[:size] = heap_node
+                    heap_cost = grown_cost
+                    heap_node = grown_node
+                i = size
+                size += 1
+                while i > 0:
+                    parent = (i - 1) // 4
+                    if new_key < heap_cost[parent] or (new_key == heap_cost[parent] and neigh < heap_node[parent]):
+                        heap_cost[i] = heap_cost[parent]
+                        heap_node[i] = heap_node[parent]
+                        i = parent
+                    else:
+                        break
+                heap_cost[i] = new_key
+                heap_node[i] = neigh
+    return dist, raw, prev
+
+
+if njit is not None:
+    # Explicit signature: compiled (or loaded from the on-disk cache) at import, not on the first plan.
+    _dijkstra_csr = njit(
+        "Tuple((f8[:], f8[:], i8[:]))(i8[:], i8[:], f8[:], f8[:], f8[:], i8, i8)", cache=True
+    )(_dijkstra_csr)
+
+
 def shortest_path(
     adjacency: Dict[str, List[Tuple[str, Dict[str, Any]]]],
     start: str | None,
     dest: str | None,
+    route_index: RouteIndex | None = None,
 ) -> Tuple[List[str], float, float]:
-    """Dijkstra on distance * difficulty. Returns (path nodes, total distance km, weighted distance)."""
+    """Dijkstra on distance * difficulty. Returns (path nodes, total distance km, weighted distance).
+
+    Expects adjacency from prepare_graph, which stores each edge's weight as `_weight`.
+    Pass a `route_index` from build_route_index to reuse it across searches (one is
+    built otherwise). The unweighted km are summed during the search itself. When the
+    index has node coordinates the search is A*, steered toward `dest`.
+    """
     if not start or not dest:
         return [], 0.0, 0.0
     if start == dest:
         return [start], 0.0, 0.0
 
-    dist: Dict[str, float] = {start: 0.0}
-    prev: Dict[str, str] = {}
-    heap: List[Tuple[float, str]] = [(0.0, start)]
+    if route_index is None:
+        route_index = build_route_index(adjacency)
+    source = route_index.index.get(start)
+    target = route_index.index.get(dest)
+    if source is None or target is None:
+        return [], 0.0, 0.0
 
+    if route_index.csr is not None:
+        indptr, indices, weights, lengths = route_index.csr
+        if route_index.coords is not None:
+            coords = np.asarray(route_index.coords)
+            bound = route_index.bound * np.hypot(*(coords - coords[target]).T)
+        else:
+            bound = np.zeros(len(route_index.ids))
+        dist, raw, prev = _dijkstra_csr(indptr, indices, weights, lengths, bound, source, target)
+        cost = float(dist[target])
+        if cost == math.inf:
+            return [], 0.0, 0.0
+        total_distance = float(raw[target])
+        order = [target]
+        while order[-1] != source:
+            order.append(int(prev[order[-1]]))
+        order.reverse()
+    else:
+        if route_index.coords is not None:
+            cost, total_distance, order = _astar_search(
+                route_index.neighbours, route_index.coords, route_index.bound, source, target
+            )
+        else:
+            cost, total_distance, order = _bidirectional_search(route_index.neighbours, source, target)
+        if not order:
+            return [], 0.0, 0.0
+
+    ids = route_index.ids
+    return [ids[i] for i in order], total_distance, cost
+
+
+def _astar_search(
+    neighbours: List[List[Tuple[int, float, float]]],
+    coords: List[Tuple[float, float]],
+    scale: float,
+    source: int,
+    target: int,
+) -> Tuple[float, float, List[int]]:
+    """A* from source to target, bounded by scale * straight-line distance; returns (cost, km, node indices) or (inf, 0, [])."""
+    goal = coords[target]
+    inf = math.inf
+    bound: Dict[int, float] = {source: scale * math.dist(coords[source], goal)}
+    dist: Dict[int, float] = {source: 0.0}
+    raw: Dict[int, float] = {source: 0.0}
+    prev: Dict[int, int] = {}
+    heap: List[Tuple[float, int]] = [(bound[source], source)]
     while heap:
-        cost, node = heappop(heap)
-        if node == dest:
+        key, node = heappop(heap)
+        if node == target:
+            order = [target]
+            while order[-1] != source:
+                order.append(prev[order[-1]])
+            order.reverse()
+            return dist[target], raw[target], order
+        cost = dist[node]
+        if key > cost + bound[node]:
+            continue
+        for neigh, weight, km in neighbours[node]:
+            new_cost = cost + weight
+            if new_cost < dist.get(neigh, inf):
+                dist[neigh] = new_cost
+                raw[neigh] = raw[node] + km
+                prev[neigh] = node
+                if neigh not in bound:
+                    bound[neigh] = scale * math.dist(coords[neigh], goal)
+                heappush(heap, (new_cost + bound[neigh], neigh))
+    return inf, 0.0, []
+
+
+def _bidirectional_search(
+    neighbours: List[List[Tuple[int, float, float]]], source: int, target: int
+) -> Tuple[float, float, List[int]]:
+    """Point-to-point Dijkstra growing from both ends; returns (cost, km, node indices) or (inf, 0, []).
+
+    Edges are undirected (prepare_graph stores both directions), so the backward
+    search walks the same neighbour lists. Each step expands the side with the
+    smaller heap and the search stops once the two heap tops can't beat the best
+    meeting cost found so far.
+    """
+    inf = math.inf
+    dist_f: Dict[int, float] = {source: 0.0}
+    dist_b: Dict[int, float] = {target: 0.0}
+    raw_f: Dict[int, float] = {source: 0.0}
+    raw_b: Dict[int, float] = {target: 0.0}
+    prev_f: Dict[int, int] = {}
+    prev_b: Dict[int, int] = {}
+    heap_f: List[Tuple[float, int]] = [(0.0, source)]
+    heap_b: List[Tuple[float, int]] = [(0.0, target)]
+    best = inf
+    best_raw = 0.0
+    meet = -1
+    while heap_f and heap_b:
+        if heap_f[0][0] + heap_b[0][0] >= best:
             break
-        if cost > dist.get(node, float("inf")):
+        if len(heap_f) <= len(heap_b):
+            heap, dist, raw, prev, other, other_raw = heap_f, dist_f, raw_f, prev_f, dist_b, raw_b
+        else:
+            heap, dist, raw, prev, other, other_raw = heap_b, dist_b, raw_b, prev_b, dist_f, raw_f
+        cost, node = heappop(heap)
+        if cost > dist[node]:
             continue
-        for neigh, attrs in adjacency.get(node, []):
-            base = attrs.get("approx_distance_km", 0.0)
-            weight = base * difficulty_for_edge(attrs)
+        for neigh, weight, km in neighbours[node]:
             new_cost = cost + weight
-            if new_cost < dist.get(neigh, float("inf")):
+            if new_cost < dist.get(neigh, inf):
                 dist[neigh] = new_cost
+                raw[neigh] = raw[node] + km
                 prev[neigh] = node
                 heappush(heap, (new_cost, neigh))
-
-    if dest not in dist:
-        return [], 0.0, 0.0
-
-    # reconstruct path
-    path: List[str] = []
-    cur = dest
-    total_distance = 0.0
-    while cur != start:
-        path.append(cur)
-        prev_node = prev[cur]
-        # add base distance (non-weighted) for reporting
-        for neigh, attrs in adjacency.get(prev_node, []):
-            if neigh == cur:
-                total_distance += attrs.get("approx_distance_km", 0.0)
-                break
-        cur = prev_node
-    path.append(start)
-    path.reverse()
-    return path, total_distance, dist[dest]
+            if neigh in other:
+                through = dist[neigh] + other[neigh]
+                if through < best:
+                    best = through
+                    best_raw = raw[neigh] + other_raw[neigh]
+                    meet = neigh
+    if meet < 0:
+        return inf, 0.0, []
+    order = [meet]
+    while order[-1] != source:
+        order.append(prev_f[order[-1]])
+    order.reverse()
+    while order[-1] != target:
+        order.append(prev_b[order[-1]])
+    return best, best_raw, order
 
 
 @dataclass
@@ -158,6 +426,7 @@ class ActiveLeg:
     attrs: Dict[str, Any]
     distance_km: float
     traveled_km: float = 0.0
+    difficulty: float = 1.0
 
     @property
     def remaining_km(self) -> float:
@@ -168,6 +437,10 @@ class TravelSession:
     def __init__(self, nodes: Dict[str, Dict[str, Any]], adjacency: Dict[str, List[Tuple[str, Dict[str, Any]]]]) -> None:
         self.nodes = nodes
         self.adjacency = adjacency
+        # current -> neighbour -> attrs (the last listed edge wins for parallel routes).
+        self._adj_map: Dict[str, Dict[str, Dict[str, Any]]] = {
+            src: {neighbor: attrs for neighbor, attrs in routes} for src, routes in adjacency.items()
+        }
         self.start_city: str | None = None
         self.destination_city: str | None = None
         self.current_city: str | None = None
@@ -197,9 +470,7 @@ class TravelSession:
             raise RuntimeError("Already traveling along a route.")
         if destination == self.current_city:
             raise ValueError("Already at that location.")
-        options = {
-            neighbor: attrs for neighbor, attrs in self.available_routes()
-        }
+        options = self._adj_map.get(self.current_city, {})
         if destination not in options:
             raise ValueError(f"No route from {self.current_city} to {destination}.")
 
@@ -211,6 +482,7 @@ class TravelSession:
             destination=destination,
             attrs=attrs,
             distance_km=distance_km,
+            difficulty=difficulty_for_edge(attrs),
         )
         self.log.append(
             f"Departed {self.current_city} toward {destination} "
@@ -226,17 +498,19 @@ class TravelSession:
 
         self.day += 1
         speed = speed_for_mode(mode)
-        difficulty = difficulty_for_edge(self.active_leg.attrs)
-        potential_km = speed/10*3.6 * hours * difficulty
+        kmh = kmh_for_mode(mode)
+        difficulty = self.active_leg.difficulty
+        potential_km = kmh * hours * difficulty
         remaining = self.active_leg.remaining_km
         traveled = min(potential_km, remaining)
         self.active_leg.traveled_km += traveled
         self.total_traveled_km += traveled
 
-        reached_destination = math.isclose(self.active_leg.traveled_km, self.active_leg.distance_km) or self.active_leg.traveled_km >= self.active_leg.distance_km
+        # traveled_km never exceeds distance_km, so this is math.isclose's default 1e-9 relative tolerance.
+        reached_destination = self.active_leg.traveled_km >= self.active_leg.distance_km * (1 - 1e-9)
 
         day_entry = (
-            f"Day {self.day}: {mode} for {hours:.1f}h at B{speed}/{speed/10*3.6:.1f} km/h "
+            f"Day {self.day}: {mode} for {hours:.1f}h at B{speed}/{kmh:.1f} km/h "
             f"(difficulty {difficulty:.2f}); covered {traveled:.1f} km"
         )
         self.log.append(day_entry)
@@ -267,21 +541,40 @@ class TravelApp(tk.Tk):
         self.graph_path = graph_path
         data = load_graph(graph_path)
         self.nodes, self.adjacency = prepare_graph(data)
+        try:
+            self.route_index = build_route_index(self.adjacency, self.nodes)
+        except ValueError as exc:
+            raise SystemExit(f"Invalid graph: {exc}")
         if not self.nodes:
             raise SystemExit("Graph has no nodes. Generate it first.")
 
         self.session = TravelSession(self.nodes, self.adjacency)
-
-        self.start_var = tk.StringVar(value=list(self.nodes.keys())[0])
-        self.dest_var = tk.StringVar(value=list(self.nodes.keys())[0])
+        # Shortest paths by (start, destination); the graph doesn't change after load.
+        self._path_cache: Dict[Tuple[str | None, str | None], Tuple[List[str], float, float]] = {}
+
+        # Both comboboxes list the same ids, and both trip ends default to the first node.
+        self._node_ids_sorted = sorted(self.nodes)
+        first_node = next(iter(self.nodes))
+        self.start_var = tk.StringVar(value=first_node)
+        self.dest_var = tk.StringVar(value=first_node)
         self.mode_var = tk.StringVar(value=DEFAULT_ALLOWED_MODES[0])
         self.hours_var = tk.DoubleVar(value=8.0)
         self.route_selection: List[str] = []
         self.plan_text = tk.StringVar(value="Select start and destination to see a route plan.")
 
+        # Pending after() id for the debounced projection update, and the inputs the
+        # plan box was last rendered from.
+        self._projection_after: str | None = None
+        self._plan_state: Tuple[Any, ...] | None = None
+        self._plan_text: str | None = None
+        # Log list last shown in log_box and how many of its entries are already there.
+        self._log_shown: List[str] | None = None
+        self._log_rendered = 0
+        self._routes_key: Tuple[str | None, bool] | None = None
+
         self._build_widgets()
-        self.mode_var.trace_add("write", lambda *_: self.update_projection())
-        self.hours_var.trace_add("write", lambda *_: self.update_projection())
+        self.mode_var.trace_add("write", lambda *_: self._schedule_projection_update())
+        self.hours_var.trace_add("write", lambda *_: self._schedule_projection_update())
         self.session.reset_trip(self.start_var.get(), self.dest_var.get())
         self.refresh_ui()
 
@@ -290,11 +583,11 @@ class TravelApp(tk.Tk):
         top_frame.pack(fill="x")
 
         ttk.Label(top_frame, text="Start:").grid(row=0, column=0, sticky="w")
-        start_menu = ttk.Combobox(top_frame, textvariable=self.start_var, values=sorted(self.nodes.keys()), state="readonly", width=18)
+        start_menu = ttk.Combobox(top_frame, textvariable=self.start_var, values=self._node_ids_sorted, state="readonly", width=18)
         start_menu.grid(row=0, column=1, padx=5)
 
         ttk.Label(top_frame, text="Destination:").grid(row=0, column=2, sticky="w")
-        dest_menu = ttk.Combobox(top_frame, textvariable=self.dest_var, values=sorted(self.nodes.keys()), state="readonly", width=18)
+        dest_menu = ttk.Combobox(top_frame, textvariable=self.dest_var, values=self._node_ids_sorted, state="readonly", width=18)
         dest_menu.grid(row=0, column=3, padx=5)
 
         ttk.Button(top_frame, text="Start Trip", command=self.start_trip).grid(row=0, column=4, padx=10)
@@ -406,20 +699,26 @@ class TravelApp(tk.Tk):
             status_text = "No active trip."
         self.status_label.config(text=status_text)
 
-        # Update routes list
-        self.routes_list.delete(0, tk.END)
-        self.route_selection = []
-        if not self.session.active_leg and self.session.current_city:
-            for neighbor, attrs in self.session.available_routes():
-                dist = attrs.get("approx_distance_km", 0.0)
-                rtype = attrs.get("route_type")
-                if not rtype and isinstance(attrs.get("route_types"), list) and attrs["route_types"]:
-                    rtype = ", ".join(attrs["route_types"])
-                label = f"to {neighbor} — {dist:.1f} km via {rtype or 'route'}"
-                self.routes_list.insert(tk.END, label)
-                self.route_selection.append(neighbor)
-        else:
-            self.routes_list.insert(tk.END, "Currently traveling; new routes available on arrival.")
+        # Update routes list; it only depends on where we are and whether we're on a leg.
+        choosing = bool(not self.session.active_leg and self.session.current_city)
+        routes_key = (self.session.current_city, choosing)
+        if routes_key != self._routes_key:
+            self._routes_key = routes_key
+            self.routes_list.delete(0, tk.END)
+            self.route_selection = []
+            if choosing:
+                labels: List[str] = []
+                for neighbor, attrs in self.session.available_routes():
+                    dist = attrs.get("approx_distance_km", 0.0)
+                    rtype = attrs.get("route_type")
+                    if not rtype and isinstance(attrs.get("route_types"), list) and attrs["route_types"]:
+                        rtype = ", ".join(attrs["route_types"])
+                    labels.append(f"to {neighbor} — {dist:.1f} km via {rtype or 'route'}")
+                    self.route_selection.append(neighbor)
+                if labels:
+                    self.routes_list.insert(tk.END, *labels)
+            else:
+                self.routes_list.insert(tk.END, "Currently traveling; new routes available on arrival.")
 
         # Update leg status
         if self.session.active_leg:
@@ -438,12 +737,30 @@ class TravelApp(tk.Tk):
         self.update_projection()
         self.update_plan_box()
 
-        # Refresh log box
-        self.log_box.config(state="normal")
-        self.log_box.delete("1.0", tk.END)
-        for entry in self.session.log:
-            self.log_box.insert(tk.END, entry + "\n")
-        self.log_box.config(state="disabled")
+        # Refresh log box: append new entries; rebuild only when the trip (and its log) was reset.
+        log = self.session.log
+        rebuild = log is not self._log_shown or len(log) < self._log_rendered
+        if rebuild or len(log) > self._log_rendered:
+            self.log_box.config(state="normal")
+            if rebuild:
+                self.log_box.delete("1.0", tk.END)
+                self._log_shown = log
+                self._log_rendered = 0
+            new_entries = log[self._log_rendered:]
+            if new_entries:
+                self.log_box.insert(tk.END, "".join(entry + "\n" for entry in new_entries))
+            self._log_rendered = len(log)
+            self.log_box.config(state="disabled")
+
+    def _schedule_projection_update(self) -> None:
+        # Coalesce bursts of edits (e.g. typing in the hours box) into one update.
+        if self._projection_after is not None:
+            self.after_cancel(self._projection_after)
+        self._projection_after = self.after(100, self._run_projection_update)
+
+    def _run_projection_update(self) -> None:
+        self._projection_after = None
+        self.update_projection()
 
     def update_projection(self) -> None:
         if not self.session.active_leg:
@@ -454,32 +771,46 @@ class TravelApp(tk.Tk):
             hours = float(self.hours_var.get())
         except Exception:
             hours = 0.0
-        speed = speed_for_mode(self.mode_var.get())
-        difficulty = difficulty_for_edge(leg.attrs)
-        projected = speed/10*3.6 * hours * difficulty
+        mode = self.mode_var.get()
+        speed = speed_for_mode(mode)
+        kmh = kmh_for_mode(mode)
+        difficulty = leg.difficulty
+        projected = kmh * hours * difficulty
         text = (
-            f"Projection: {hours:.1f}h at B{speed}/{speed/10*3.6:.1f} km/h "
+            f"Projection: {hours:.1f}h at B{speed}/{kmh:.1f} km/h "
             f"x difficulty {difficulty:.2f} → ~{projected:.1f} km"
         )
         self.projection_label.config(text=text)
 
+    def cached_shortest_path(self, start: str | None, dest: str | None) -> Tuple[List[str], float, float]:
+        key = (start, dest)
+        result = self._path_cache.get(key)
+        if result is None:
+            result = self._path_cache[key] = shortest_path(self.adjacency, start, dest, self.route_index)
+        return result
+
     def update_plan_box(self) -> None:
         # Compute shortest path from current (or arriving) node to final destination.
         dest = self.session.destination_city
+        active_leg = self.session.active_leg
+        remaining_leg_km = active_leg.remaining_km if active_leg else 0.0
+        start_node = active_leg.destination if active_leg else self.session.current_city
+        mode = self.mode_var.get()
+        # Everything the text below depends on; skip the path lookup and the text when unchanged.
+        plan_state = (dest, start_node, active_leg.origin if active_leg else None, remaining_leg_km, mode)
+        if plan_state == self._plan_state:
+            return
+        self._plan_state = plan_state
         if not dest:
             plan_text = "Select a destination to see a shortest path plan."
         else:
-            active_leg = self.session.active_leg
-            remaining_leg_km = active_leg.remaining_km if active_leg else 0.0
-            start_node = active_leg.destination if active_leg else self.session.current_city
-            path_nodes, path_dist, _weighted = shortest_path(self.adjacency, start_node, dest)
+            path_nodes, path_dist, _weighted = self.cached_shortest_path(start_node, dest)
             if not path_nodes:
                 plan_text = f"No path found from {start_node} to {dest}."
             else:
-                mode = self.mode_var.get()
-                speed = speed_for_mode(mode)
+                kmh = kmh_for_mode(mode)
                 total_dist = remaining_leg_km + path_dist
-                est_hours = total_dist / (speed/10*3.6) if speed > 0 else 0
+                est_hours = total_dist / kmh if kmh > 0 else 0
                 remaining_leg_text = ""
                 if active_leg:
                     remaining_leg_text = (
@@ -493,8 +824,11 @@ class TravelApp(tk.Tk):
                     f"Shortest path from {start_node} to {dest}:\n"
                     f"{path_line}\n"
                     f"Total distance (including current leg): {total_dist:.1f} km\n"
-                    f"Est. travel time at {mode} ({speed/10*3.6:.1f} km/h): {est_hours:.1f} hours"
+                    f"Est. travel time at {mode} ({kmh:.1f} km/h): {est_hours:.1f} hours"
                 )
+        if plan_text == self._plan_text:
+            return
+        self._plan_text = plan_text
         self.plan_box.config(state="normal")
         self.plan_box.delete("1.0", tk.END)
         self.plan_box.insert(tk.END, plan_text)
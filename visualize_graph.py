@@ -10,13 +10,16 @@ window). Requires matplotlib and networkx.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, Tuple
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import networkx as nx
+import numpy as np
 
 def load_graph(path: Path) -> Dict[str, Any]:
     with path.open(encoding="utf-8") as f:
@@ -25,15 +28,47 @@ def load_graph(path: Path) -> Dict[str, Any]:
 
 def build_graph(data: Dict[str, Any], nx: Any) -> Any:
     G = nx.Graph()
-    for node in data.get("nodes", []):
-        G.add_node(node["id"], **node)
-    for edge in data.get("edges", []):
-        a, b = edge["nodes"]
-        attrs = {k: v for k, v in edge.items() if k != "nodes"}
-        G.add_edge(a, b, **attrs)
+    G.add_nodes_from((node["id"], node) for node in data.get("nodes", []))
+    G.add_edges_from(
+        (*edge["nodes"], {k: v for k, v in edge.items() if k != "nodes"})
+        for edge in data.get("edges", [])
+    )
     return G
 
 
+def layout_cache_path(graph_path: Path) -> Path:
+    """Where the layout for this exact graph file is cached, keyed on a hash of its bytes."""
+    digest = hashlib.blake2b(graph_path.read_bytes(), digest_size=16).hexdigest()
+    return Path.home() / ".cache" / "midgard" / f"layout-{digest}.npz"
+
+
+def layout_graph(G: Any, cache_path: Path | None = None) -> Dict[Any, Any]:
+    """spring_layout(seed=42), reusing the positions saved in `cache_path` when it holds them."""
+    if cache_path is not None and cache_path.exists():
+        try:
+            with np.load(cache_path) as cached:
+                ids, xy = cached["ids"], cached["xy"]
+            by_id = {str(n): n for n in G.nodes}
+            if len(ids) == len(by_id) and all(i in by_id for i in ids):
+                return {by_id[i]: row for i, row in zip(ids, xy)}
+        except Exception:
+            pass  # unreadable or stale cache; lay out again below
+
+    pos = nx.spring_layout(G, seed=42)
+    if cache_path is not None:
+        ids = sorted(pos, key=str)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(
+                cache_path,
+                ids=np.array([str(n) for n in ids], dtype=str),
+                xy=np.array([pos[n] for n in ids], dtype=np.float64).reshape(-1, 2),
+            )
+        except OSError:
+            pass  # caching is best effort
+    return pos
+
+
 def route_style(route_type: str) -> Tuple[str, str]:
     palette = {
         "road": ("#c78b35", "solid"),
@@ -46,47 +81,61 @@ def route_style(route_type: str) -> Tuple[str, str]:
     return palette.get(route_type, ("#6e6e6e", "solid"))
 
 
-def draw_graph(G: Any, plt: Any, out_path: Path, show: bool) -> None:
+def draw_graph(G: Any, plt: Any, out_path: Path, show: bool, pos: Dict[Any, Any] | None = None) -> None:
     # Deterministic layout for repeatable positioning.
-    pos = nx.spring_layout(G, seed=42)
+    if pos is None:
+        pos = layout_graph(G)
 
     fig, ax = plt.subplots(figsize=(10, 7))
     ax.set_facecolor("#f7f7fb")
     ax.margins(0.1)
 
-    # Draw edges grouped by route_type to allow per-type styling.
-    edges_by_type: Dict[str, list] = defaultdict(list)
+    # Node positions as one array; edges index into it by node position.
+    index = {n: i for i, n in enumerate(G.nodes)}
+    pos_arr = np.array([pos[n] for n in G.nodes], dtype=np.float64).reshape(-1, 2)
+
+    # Draw edges grouped by (color, style), one LineCollection per group.
+    edges_by_style: Dict[Tuple[str, str], list] = defaultdict(list)
     for u, v, attrs in G.edges(data=True):
-        edges_by_type[attrs.get("route_type", "other")].append((u, v))
-
-    for rtype, edgelist in edges_by_type.items():
-        color, style = route_style(rtype)
-        nx.draw_networkx_edges(
-            G,
-            pos,
-            edgelist=edgelist,
-            edge_color=color,
-            style=style,
-            width=2.0,
-            alpha=0.85,
-            ax=ax,
+        edges_by_style[route_style(attrs.get("route_type", "other"))].append((index[u], index[v]))
+
+    for (color, style), pairs in edges_by_style.items():
+        segments = pos_arr[np.array(pairs, dtype=np.intp)]  # (E, 2, 2)
+        ax.add_collection(
+            LineCollection(
+                segments,
+                colors=color,
+                linestyles=style,
+                linewidths=2.0,
+                alpha=0.85,
+                antialiaseds=(1,),
+                zorder=1,
+            )
         )
-
-    # Node visuals
-    node_colors = [
-        "#1b9e77" if G.nodes[n].get("is_port") else "#7570b3" for n in G.nodes
-    ]
-    node_sizes = [350 + min(G.nodes[n].get("population", 0) ** 0.5, 200) for n in G.nodes]
-
-    nx.draw_networkx_nodes(
-        G,
-        pos,
-        node_color=node_colors,
-        node_size=node_sizes,
+        # Same 5% padding around each group that draw_networkx_edges applied.
+        lo, hi = segments.min(axis=(0, 1)), segments.max(axis=(0, 1))
+        pad = 0.05 * (hi - lo)
+        ax.update_datalim([lo - pad, hi + pad])
+
+    # Node visuals, gathered into arrays once (G.nodes order).
+    count = G.number_of_nodes()
+    is_port = np.fromiter((bool(attrs.get("is_port")) for _, attrs in G.nodes(data=True)), dtype=bool, count=count)
+    population = np.fromiter(
+        (attrs.get("population", 0) for _, attrs in G.nodes(data=True)), dtype=np.float64, count=count
+    )
+    node_colors = np.where(is_port, "#1b9e77", "#7570b3")
+    node_sizes = 350 + np.minimum(np.sqrt(population), 200)
+
+    ax.scatter(
+        pos_arr[:, 0],
+        pos_arr[:, 1],
+        s=node_sizes,
+        c=node_colors,
         edgecolors="#2c2c34",
         linewidths=0.9,
-        ax=ax,
+        zorder=2,
     )
+    ax.autoscale_view()
     nx.draw_networkx_labels(G, pos, font_size=9, font_weight="bold", ax=ax)
 
     ax.set_title("Midgard Travel Map", fontsize=14, fontweight="bold")
@@ -135,6 +184,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Display an interactive window after saving the image.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute the layout instead of reusing the one cached in ~/.cache/midgard.",
+    )
     return parser.parse_args()
 
 
@@ -142,7 +196,8 @@ def main() -> None:
     args = parse_args()
     data = load_graph(args.graph)
     graph = build_graph(data, nx)
-    draw_graph(graph, plt, args.out, args.show)
+    pos = layout_graph(graph, None if args.no_cache else layout_cache_path(args.graph))
+    draw_graph(graph, plt, args.out, args.show, pos)
     print(f"Saved graph visualization to {args.out}")
 
 